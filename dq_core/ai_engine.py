@@ -2,14 +2,18 @@
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from openai import OpenAI
 from dotenv import load_dotenv
 import streamlit as st
+from dq_core.profiler import profile_patterns, profile_dataframe
 
 api_key = os.getenv("OPENAI_API_KEY") or st.secrets.get("OPENAI_API_KEY")
 client = OpenAI(api_key=api_key)
 MODEL = "gpt-4.1-mini"
+CONTRACT_GROUP_TOKEN_BUDGET = 4000
+CONTRACT_MAX_WORKERS = 8
 
 # ---------------------- Constants ----------------------
 
@@ -21,13 +25,20 @@ Description: {prompt}
 Here are 5 sample values from the column:
 {samples}
 
+Column value profile (semantic type and most frequent value shapes; A=uppercase, a=lowercase, 9=digit):
+{patterns}
+
 Please return a JSON object of contract rules. Example format:
 {{
   "not_null": true,
   "unique": false,
   "regex": "^[A-Z]{{2}}\\d{{4}}$",
   "min": 0,
-  "max": 100
+  "max": 100,
+  "allowed_values": ["A", "B"],
+  "min_length": 1,
+  "max_length": 10,
+  "max_age_days": 7
 }}
 Only include relevant keys. No explanations.
 """
@@ -47,18 +58,24 @@ You are an expert data quality assistant. Your task is to generate a complete da
 
 User prompt: "{prompt}"
 
-Here is a preview of the dataset (10 rows):
-{preview}
+Dataset: {row_count} rows, {column_count} columns. {group_note}
+Column profile (one line per column: name | dtype | null% | unique% | range or semantic type and top value shapes;
+shapes use A=uppercase, a=lowercase, 9=digit):
+{columns}
 
 Return a JSON with:
-- dataset_checks: general rules like row count minimum, schema enforcement, etc.
-- column_checks: rules per column (nulls, unique, type, ranges, patterns)
+- dataset_checks: general rules like row count minimum, schema enforcement, composite key uniqueness,
+  duplicate rows, and cross-column comparisons (e.g. "start_date <= end_date")
+- column_checks: rules per column (nulls, unique, type, ranges, patterns), only for the columns listed above
 
 Only return a JSON object like this:
 {{
   "dataset_checks": {{
     "row_count_min": 1000,
-    "schema_match": true
+    "schema_match": true,
+    "unique_key": ["order_id", "line_no"],
+    "no_duplicate_rows": true,
+    "column_comparisons": ["start_date <= end_date"]
   }},
   "column_checks": {{
     "column1": {{ "not_null": true, "unique": true }},
@@ -68,18 +85,107 @@ Only return a JSON object like this:
 Do not include any explanation or notes.
 """
 
+COLUMN_GROUP_PROMPT = """
+You are an expert data quality assistant. Your task is to generate column rules for part of a data validation contract.
+
+User prompt: "{prompt}"
+
+Dataset: {row_count} rows, {column_count} columns. Columns group {group} of {group_count}.
+Column profile (one line per column: name | dtype | null% | unique% | range or semantic type and top value shapes;
+shapes use A=uppercase, a=lowercase, 9=digit):
+{columns}
+
+Return a JSON with column_checks: rules per column (nulls, unique, type, ranges, patterns), only for the columns listed above.
+Dataset-level rules are generated separately.
+
+Only return a JSON object like this:
+{{
+  "column_checks": {{
+    "column1": {{ "not_null": true, "unique": true }},
+    "column2": {{ "regex": "...", "min": 0 }}
+  }}
+}}
+Do not include any explanation or notes.
+"""
+
+DATASET_CHECKS_PROMPT = """
+You are an expert data quality assistant. Your task is to generate the dataset-level rules of a data validation contract.
+
+User prompt: "{prompt}"
+
+Dataset: {row_count} rows, {column_count} columns.
+Columns (name | dtype | unique%):
+{columns}
+
+Return a JSON with dataset_checks: general rules like row count minimum, schema enforcement, composite key
+uniqueness, duplicate rows, and cross-column comparisons (e.g. "start_date <= end_date"), using only the columns above.
+
+Only return a JSON object like this:
+{{
+  "dataset_checks": {{
+    "row_count_min": 1000,
+    "schema_match": true,
+    "unique_key": ["order_id", "line_no"],
+    "no_duplicate_rows": true,
+    "column_comparisons": ["start_date <= end_date"]
+  }}
+}}
+Do not include any explanation or notes.
+"""
+
 # ---------------------- Utility ----------------------
 
 def get_sample_values(series: pd.Series, n=5):
     return series.dropna().astype(str).sample(min(n, len(series))).tolist()
 
+def get_pattern_summary(series: pd.Series) -> dict:
+    if series.dtype.kind in "iufc":
+        return {"semantic_type": "numeric", "min": float(series.min()), "max": float(series.max())}
+    profile = profile_patterns(series)
+    profile["patterns"] = profile["patterns"][:5]
+    return profile
+
+def estimate_tokens(text: str) -> int:
+    # Rough estimate (~4 characters per token) used to size prompts before sending
+    return len(text) // 4 + 1
+
+def summarize_column(name, col_profile: dict) -> str:
+    parts = [
+        str(name),
+        col_profile["dtype"],
+        f"{col_profile['null_ratio']:.1%} null",
+        f"{col_profile['unique_ratio']:.1%} unique"
+    ]
+    if "min" in col_profile:
+        parts.append(f"{col_profile['min']}..{col_profile['max']}")
+    elif col_profile.get("semantic_type"):
+        shapes = ", ".join(f"{p['pattern']} {p['ratio']:.0%}" for p in col_profile.get("patterns", [])[:3])
+        parts.append(f"{col_profile['semantic_type']}; {shapes}")
+    return " | ".join(parts)
+
+def summarize_column_brief(name, col_profile: dict) -> str:
+    return f"{name} | {col_profile['dtype']} | {col_profile['unique_ratio']:.0%}"
+
+def group_columns_by_tokens(lines: list, budget: int = CONTRACT_GROUP_TOKEN_BUDGET) -> list:
+    groups, current, used = [], [], 0
+    for line in lines:
+        cost = estimate_tokens(line)
+        if current and used + cost > budget:
+            groups.append(current)
+            current, used = [], 0
+        current.append(line)
+        used += cost
+    if current:
+        groups.append(current)
+    return groups
+
 # ---------------------- AI Logic ----------------------
 
 def generate_contract_from_prompt(prompt: str, column_data: pd.Series) -> dict:
-    samples = get_sample_values(column_data)
-    input_str = RULE_GEN_PROMPT.format(prompt=prompt, samples=samples)
-
     try:
+        samples = get_sample_values(column_data)
+        patterns = get_pattern_summary(column_data)
+        input_str = RULE_GEN_PROMPT.format(prompt=prompt, samples=samples, patterns=patterns)
         response = client.chat.completions.create(
             model=MODEL,
             messages=[
@@ -111,22 +217,82 @@ def explain_failure(summary: str, column_data: pd.Series) -> str:
     except Exception as e:
         return f"⚠️ AI explanation failed: {e}"
 
+def _generate_contract_part(input_str: str) -> dict:
+    response = client.chat.completions.create(
+        model=MODEL,
+        messages=[
+            {"role": "system", "content": "You generate JSON validation contracts for datasets."},
+            {"role": "user", "content": input_str}
+        ],
+        temperature=0.3,
+        response_format={"type": "json_object"}
+    )
+    contract_json = response.choices[0].message.content.strip()
+    return json.loads(contract_json)
+
 def generate_full_contract(prompt: str, df: pd.DataFrame) -> dict:
-    sample_rows = df.sample(min(10, len(df)))
-    preview = sample_rows.to_dict(orient="records")
-    input_str = FULL_CONTRACT_PROMPT.format(prompt=prompt, preview=preview)
+    """
+    Generates a full contract from a compact, per-column profile of the dataset.
+    Wide tables are split into column groups that fit the token budget; groups are
+    generated concurrently and merged into one contract. For split tables the
+    dataset-level rules come from one extra request over a brief summary of all
+    columns, so keys and comparisons can span groups.
+    """
+    if df.columns.empty or df.empty:
+        print("[AI ERROR] Contract generation skipped: dataset has no rows or columns.")
+        return {}
 
     try:
-        response = client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": "You generate JSON validation contracts for datasets."},
-                {"role": "user", "content": input_str}
-            ],
-            temperature=0.3
-        )
-        contract_json = response.choices[0].message.content.strip()
-        return json.loads(contract_json)
+        profile = profile_dataframe(df)
+        lines = [summarize_column(col, col_profile) for col, col_profile in profile["columns"].items()]
+        groups = group_columns_by_tokens(lines)
     except Exception as e:
-        print(f"[AI ERROR] Contract generation failed: {e}")
+        print(f"[AI ERROR] Contract generation failed while profiling: {e}")
+        return {}
+
+    if len(groups) == 1:
+        prompts = [FULL_CONTRACT_PROMPT.format(
+            prompt=prompt,
+            row_count=profile["row_count"],
+            column_count=profile["column_count"],
+            group_note="",
+            columns="\n".join(groups[0])
+        )]
+    else:
+        brief = [summarize_column_brief(col, col_profile) for col, col_profile in profile["columns"].items()]
+        prompts = [DATASET_CHECKS_PROMPT.format(
+            prompt=prompt,
+            row_count=profile["row_count"],
+            column_count=profile["column_count"],
+            columns="\n".join(brief)
+        )]
+        for i, group in enumerate(groups):
+            prompts.append(COLUMN_GROUP_PROMPT.format(
+                prompt=prompt,
+                row_count=profile["row_count"],
+                column_count=profile["column_count"],
+                group=i + 1,
+                group_count=len(groups),
+                columns="\n".join(group)
+            ))
+    print(f"[AI] Contract generation: {len(prompts)} request(s), ~{sum(estimate_tokens(p) for p in prompts)} prompt tokens.")
+
+    contract = {"dataset_checks": {}, "column_checks": {}}
+    failures = 0
+    with ThreadPoolExecutor(max_workers=min(CONTRACT_MAX_WORKERS, len(prompts))) as pool:
+        futures = [pool.submit(_generate_contract_part, p) for p in prompts]
+        for i, future in enumerate(futures):
+            try:
+                part = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"[AI ERROR] Contract generation failed for request {i + 1}/{len(prompts)}: {e}")
+                continue
+            # Dataset rules only come from the first request (the whole table or the all-columns summary)
+            if i == 0:
+                contract["dataset_checks"] = part.get("dataset_checks") or {}
+            contract["column_checks"].update(part.get("column_checks") or {})
+
+    if failures == len(prompts):
         return {}
+    return contract
@@ -3,7 +3,8 @@ import pandas as pd
 def scan_for_anomalies(
     df: pd.DataFrame,
     z_threshold: float = 3.0,
-    outlier_pct_limit: float = 0.01
+    outlier_pct_limit: float = 0.01,
+    progress=None
 ) -> list:
     """
     Scans the numeric columns of a DataFrame for anomalies based on Z-score.
@@ -12,6 +13,7 @@ def scan_for_anomalies(
         df (pd.DataFrame): Input data.
         z_threshold (float): Threshold beyond which values are considered outliers.
         outlier_pct_limit (float): Minimum proportion of outliers required to flag column.
+        progress (callable): Optional callback progress(done, total, message), called per column.
 
     Returns:
         List of anomaly dictionaries for flagged columns.
@@ -20,7 +22,10 @@ def scan_for_anomalies(
 
     numeric_cols = df.select_dtypes(include=["number"]).columns
 
-    for col in numeric_cols:
+    for i, col in enumerate(numeric_cols):
+        if progress:
+            progress(i, len(numeric_cols), f"Scanning {col}")
+
         series = df[col].dropna()
 
         if series.empty:
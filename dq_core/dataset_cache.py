@@ -0,0 +1,212 @@
+# dq_core/dataset_cache.py
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+import pandas as pd
+import pyarrow as pa
+
+
+DEFAULT_CACHE_DIR = os.getenv("DQ_CACHE_DIR", os.path.join(tempfile.gettempdir(), "dq_cache"))
+DEFAULT_MEMORY_BUDGET = int(os.getenv("DQ_CACHE_BUDGET_MB", "4096")) * 1024 * 1024
+DEFAULT_LEASE_SECONDS = int(os.getenv("DQ_CACHE_LEASE_SECONDS", "1800"))
+
+
+def content_key(data) -> str:
+    """
+    Returns the cache key for raw file content (bytes or a buffer, hashed without copying).
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def frame_key(df: pd.DataFrame) -> str:
+    """
+    Returns a content-based cache key for a DataFrame (row hashes plus column names).
+    """
+    digest = hashlib.sha256(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    digest.update(repr(list(df.columns)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class _Entry:
+    def __init__(self, path: str, frame: pd.DataFrame, size: int):
+        self.path = path
+        self.frame = frame
+        self.size = size
+        self.leases: Dict[str, float] = {}
+        self.last_used = time.time()
+
+    @property
+    def refs(self) -> int:
+        return len(self.leases)
+
+
+class DatasetCache:
+    """
+    Process-wide cache of datasets keyed by content hash. Each dataset is spilled
+    once to an Arrow IPC file and memory-mapped back, so every session that loads
+    the same content shares one physical copy.
+
+    References are leases held by a named holder (one per browser session) and
+    expire after lease_seconds unless renewed, since a session can end without
+    ever releasing. Entries without a live lease are evicted in LRU order when
+    the budget is exceeded.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ):
+        self.cache_dir = cache_dir
+        self.memory_budget = memory_budget
+        self.lease_seconds = lease_seconds
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.RLock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.arrow")
+
+    @staticmethod
+    def _map(path: str) -> pd.DataFrame:
+        # split_blocks lets Arrow hand numeric columns to pandas without copying
+        table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+        return table.to_pandas(split_blocks=True)
+
+    def _spill(self, key: str, df: pd.DataFrame) -> str:
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+        return path
+
+    # ---------------------- Public API ----------------------
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Returns the cached frame for a key (re-mapping a spilled file if needed), or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                path = self._path(key)
+                if not os.path.exists(path):
+                    return None
+                entry = _Entry(path, self._map(path), os.path.getsize(path))
+                self._entries[key] = entry
+                self._evict(protect=key)
+            entry.last_used = time.time()
+            self._entries.move_to_end(key)
+            return entry.frame
+
+    def put(self, key: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Spills a frame to disk and returns its memory-mapped replacement.
+        """
+        with self._lock:
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+            try:
+                path = self._spill(key, df)
+            except (pa.ArrowException, OSError) as e:
+                # Columns Arrow cannot represent (e.g. mixed-type objects) stay private to the caller
+                print(f"[Dataset Cache] ⚠️ Not cached: {e}")
+                return df
+            entry = _Entry(path, self._map(path), os.path.getsize(path))
+            self._entries[key] = entry
+            self._evict(protect=key)
+            return entry.frame
+
+    def get_or_load(self, key: str, loader: Callable[[], pd.DataFrame], holder: str = None) -> pd.DataFrame:
+        """
+        Returns the cached frame for a key, calling loader() only on a cache miss.
+        When a holder is given, its lease is taken under the same lock that returns
+        the entry, so the entry cannot be evicted in between.
+        """
+        with self._lock:
+            cached = self.get(key)
+            if cached is not None:
+                self._lease(key, holder)
+                return cached
+        # Load outside the lock so a slow source does not block other sessions
+        df = loader()
+        with self._lock:
+            frame = self.put(key, df)
+            self._lease(key, holder)
+            return frame
+
+    def _lease(self, key: str, holder: Optional[str]) -> None:
+        entry = self._entries.get(key)
+        if holder is not None and entry is not None:
+            entry.leases[holder] = time.time() + self.lease_seconds
+
+    def acquire(self, key: str, holder: str) -> None:
+        """
+        Takes or renews holder's lease on a cached entry.
+        """
+        with self._lock:
+            self._lease(key, holder)
+
+    def release(self, key: str, holder: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.leases.pop(holder, None)
+            self._evict()
+
+    def _expire_leases(self) -> None:
+        now = time.time()
+        for entry in self._entries.values():
+            for holder in [h for h, expires in entry.leases.items() if expires <= now]:
+                del entry.leases[holder]
+
+    def _evict(self, protect: Optional[str] = None) -> None:
+        self._expire_leases()
+        used = sum(e.size for e in self._entries.values())
+        for key in list(self._entries.keys()):
+            if used <= self.memory_budget:
+                break
+            entry = self._entries[key]
+            if entry.refs > 0 or key == protect:
+                continue
+            used -= entry.size
+            del self._entries[key]
+            try:
+                os.remove(entry.path)
+            except OSError as e:
+                print(f"[Dataset Cache] ⚠️ Could not remove {entry.path}: {e}")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            self._expire_leases()
+            return {
+                "entries": len(self._entries),
+                "bytes": sum(e.size for e in self._entries.values()),
+                "budget": self.memory_budget,
+                "referenced": sum(1 for e in self._entries.values() if e.refs > 0)
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_dataset_cache() -> DatasetCache:
+    """
+    Returns the process-wide dataset cache.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = DatasetCache()
+        return _cache
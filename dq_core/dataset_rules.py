@@ -0,0 +1,353 @@
+# dq_core/dataset_rules.py
+
+import re
+import time
+import operator
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+
+SAMPLE_LIMIT = 5
+
+COMPARISON_OPS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+_COMPARISON_RE = re.compile(r"^\s*(.+?)\s*(<=|>=|==|!=|<|>)\s*(.+?)\s*$")
+_DICTIONARY_RE = re.compile(r"^dictionary<values=([^,>]+)")
+
+
+# ---------------------- Hashing ----------------------
+
+def find_duplicate_rows(df: pd.DataFrame, columns: list = None) -> pd.Series:
+    """
+    Flags rows that repeat an earlier row on the given columns (all columns by default).
+
+    Rows are first bucketed by a vectorized 64-bit hash; only rows whose hash
+    collides are compared on their actual values, so hash collisions never
+    produce false positives and no per-row tuples are built.
+
+    Returns:
+        pd.Series: Boolean mask aligned with df, True for every repeat after the first occurrence.
+    """
+    subset = df[columns] if columns else df
+    flags = np.zeros(len(df), dtype=bool)
+    if subset.empty:
+        return pd.Series(flags, index=df.index)
+
+    hashes = pd.util.hash_pandas_object(subset, index=False)
+    candidates = np.flatnonzero(hashes.duplicated(keep=False).to_numpy())
+    if candidates.size:
+        # Exact verification restricted to colliding rows
+        verified = subset.iloc[candidates].duplicated(keep="first").to_numpy()
+        flags[candidates[verified]] = True
+    return pd.Series(flags, index=df.index)
+
+
+def _sample_keys(df: pd.DataFrame, mask: pd.Series, columns: list = None) -> list:
+    rows = df[mask.to_numpy()]
+    rows = (rows[columns] if columns else rows).head(SAMPLE_LIMIT).astype(object)
+    return rows.where(rows.notna(), None).to_dict(orient="records")
+
+
+# ---------------------- Individual Rules ----------------------
+
+def _arrow_type_family(dtype: pa.DataType) -> str:
+    if pa.types.is_dictionary(dtype):
+        return _arrow_type_family(dtype.value_type)
+    if pa.types.is_boolean(dtype):
+        return "boolean"
+    if pa.types.is_integer(dtype) or pa.types.is_floating(dtype) or pa.types.is_decimal(dtype):
+        return "numeric"
+    if pa.types.is_temporal(dtype):
+        return "datetime"
+    if pa.types.is_string(dtype) or pa.types.is_large_string(dtype):
+        return "string"
+    return str(dtype)
+
+
+def type_family(dtype) -> str:
+    """
+    Maps a pandas, Arrow, Snowflake or contract type (or type name) onto a coarse family
+    (numeric, string, datetime, boolean) so schemas from different sources compare.
+    Dictionary-encoded and categorical types take the family of their values.
+    """
+    if isinstance(dtype, pa.DataType):
+        return _arrow_type_family(dtype)
+    if isinstance(dtype, pd.CategoricalDtype):
+        return type_family(dtype.categories.dtype)
+    name = str(dtype).lower()
+    match = _DICTIONARY_RE.match(name)
+    if match:
+        name = match.group(1)
+    if "bool" in name:
+        return "boolean"
+    if any(t in name for t in ("date", "time")):
+        return "datetime"
+    if any(t in name for t in ("int", "float", "double", "decimal", "number", "numeric", "real")):
+        return "numeric"
+    if any(t in name for t in ("str", "object", "char", "text", "utf8", "string", "large_string")):
+        return "string"
+    return name
+
+
+def check_row_count_min(row_count: int, min_count: int) -> dict:
+    status = "PASS" if row_count >= min_count else "FAIL"
+    return {
+        "check": "Dataset: Row Count Minimum",
+        "status": status,
+        "column": "_dataset",
+        "message": f"{row_count} rows found. Minimum expected: {min_count}.",
+        "severity": "high" if status == "FAIL" else "low",
+        "value": row_count,
+        "lower_bound": min_count
+    }
+
+
+def check_schema_match(actual_types: dict, contract_rules: dict) -> dict:
+    """
+    Compares actual columns (name -> type or type name) with the contract's columns. Column
+    rules that declare a "type" are also compared by type family.
+    """
+    contract_rules = contract_rules or {}
+    expected_cols = set(contract_rules.keys())
+    actual_cols = set(actual_types.keys())
+    missing = expected_cols - actual_cols
+    extra = actual_cols - expected_cols
+    mismatched = {
+        col: f"{rules['type']} != {actual_types[col]}"
+        for col, rules in contract_rules.items()
+        if isinstance(rules, dict) and rules.get("type") and col in actual_types
+        and type_family(rules["type"]) != type_family(actual_types[col])
+    }
+
+    if not missing and not extra and not mismatched:
+        return {
+            "check": "Dataset: Schema Match",
+            "status": "PASS",
+            "column": "_dataset",
+            "message": "Schema matches expected columns.",
+            "severity": "low"
+        }
+    message = f"Missing: {list(missing)} | Extra: {list(extra)}"
+    if mismatched:
+        message += f" | Type mismatch: {mismatched}"
+    return {
+        "check": "Dataset: Schema Match",
+        "status": "FAIL",
+        "column": "_dataset",
+        "message": message,
+        "severity": "high",
+        "failed_count": len(missing) + len(extra) + len(mismatched)
+    }
+
+
+def check_unique_key(df: pd.DataFrame, key_columns: list) -> dict:
+    check_name = f"Dataset: Unique Key ({', '.join(map(str, key_columns))})"
+    missing = [c for c in key_columns if c not in df.columns]
+    if missing:
+        return {
+            "check": check_name,
+            "status": "FAIL",
+            "column": "_dataset",
+            "message": f"Key columns not found: {missing}",
+            "severity": "high"
+        }
+
+    dup_mask = find_duplicate_rows(df, key_columns)
+    dup_count = int(dup_mask.sum())
+    if dup_count == 0:
+        return {
+            "check": check_name,
+            "status": "PASS",
+            "column": "_dataset",
+            "message": "All key values are unique.",
+            "severity": "low",
+            "failed_count": 0,
+            "total_count": len(df)
+        }
+    return {
+        "check": check_name,
+        "status": "FAIL",
+        "column": "_dataset",
+        "message": f"{dup_count} rows repeat an existing key ({dup_count / len(df):.2%}).",
+        "severity": "high",
+        "failed_count": dup_count,
+        "total_count": len(df),
+        "ratio": dup_count / len(df),
+        "sample_keys": _sample_keys(df, dup_mask, key_columns)
+    }
+
+
+def check_duplicate_rows(df: pd.DataFrame) -> dict:
+    dup_mask = find_duplicate_rows(df)
+    dup_count = int(dup_mask.sum())
+    if dup_count == 0:
+        return {
+            "check": "Dataset: No Duplicate Rows",
+            "status": "PASS",
+            "column": "_dataset",
+            "message": "No fully duplicated rows found.",
+            "severity": "low",
+            "failed_count": 0,
+            "total_count": len(df)
+        }
+    return {
+        "check": "Dataset: No Duplicate Rows",
+        "status": "FAIL",
+        "column": "_dataset",
+        "message": f"{dup_count} rows are exact duplicates ({dup_count / len(df):.2%}).",
+        "severity": "medium",
+        "failed_count": dup_count,
+        "total_count": len(df),
+        "ratio": dup_count / len(df),
+        "sample_keys": _sample_keys(df, dup_mask)
+    }
+
+
+def _parse_comparison(rule) -> tuple:
+    if isinstance(rule, str):
+        match = _COMPARISON_RE.match(rule)
+        if not match:
+            raise ValueError(f"Cannot parse comparison `{rule}`")
+        return match.group(1), match.group(2), match.group(3)
+    return rule["left"], rule["op"], rule["right"]
+
+
+def _operand(df: pd.DataFrame, token):
+    if isinstance(token, str) and token in df.columns:
+        return df[token]
+    if isinstance(token, str):
+        try:
+            return float(token)
+        except ValueError:
+            raise ValueError(f"Unknown column `{token}`")
+    return token
+
+
+def check_column_comparison(df: pd.DataFrame, rule) -> dict:
+    """
+    Evaluates a cross-column rule such as "start_date <= end_date" or
+    {"left": "min_price", "op": "<=", "right": "max_price"} as one vectorized comparison.
+    Rows where either side is null are skipped.
+    """
+    try:
+        left, op, right = _parse_comparison(rule)
+        if op not in COMPARISON_OPS:
+            raise ValueError(f"Unsupported operator `{op}`")
+        lhs, rhs = _operand(df, left), _operand(df, right)
+        if not isinstance(lhs, pd.Series) and not isinstance(rhs, pd.Series):
+            raise ValueError("at least one side must be a column")
+    except (ValueError, KeyError, TypeError) as e:
+        return {
+            "check": f"Dataset: Comparison ({rule})",
+            "status": "FAIL",
+            "column": "_dataset",
+            "message": f"Invalid comparison rule: {e}",
+            "severity": "high"
+        }
+
+    check_name = f"Dataset: {left} {op} {right}"
+    comparable = pd.Series(True, index=df.index)
+    for side in (lhs, rhs):
+        if isinstance(side, pd.Series):
+            comparable &= side.notna()
+
+    try:
+        holds = COMPARISON_OPS[op](lhs, rhs)
+    except TypeError as e:
+        return {
+            "check": check_name,
+            "status": "FAIL",
+            "column": "_dataset",
+            "message": f"Columns are not comparable: {e}",
+            "severity": "high"
+        }
+
+    violations = comparable & ~holds.fillna(False).astype(bool)
+    fail_count = int(violations.sum())
+    if fail_count == 0:
+        return {
+            "check": check_name,
+            "status": "PASS",
+            "column": "_dataset",
+            "message": "Rule holds for all comparable rows.",
+            "severity": "low",
+            "failed_count": 0,
+            "total_count": len(df)
+        }
+
+    sample_cols = [c for c in (left, right) if isinstance(c, str) and c in df.columns]
+    return {
+        "check": check_name,
+        "status": "FAIL",
+        "column": "_dataset",
+        "message": f"{fail_count} rows violate `{left} {op} {right}` ({fail_count / len(df):.2%}).",
+        "severity": "medium",
+        "failed_count": fail_count,
+        "total_count": len(df),
+        "ratio": fail_count / len(df),
+        "sample_keys": _sample_keys(df, violations, sample_cols)
+    }
+
+
+# ---------------------- Engine ----------------------
+
+def normalize_key_sets(keys) -> list:
+    """
+    Normalizes a unique_key rule into a list of key-column lists. A string is one
+    single-column key; a list of strings is one composite key; otherwise each
+    element is its own key (a string as one column, a list or tuple as a composite).
+    """
+    if not keys:
+        return []
+    if isinstance(keys, str):
+        return [[keys]]
+    if all(isinstance(k, str) for k in keys):
+        return [list(keys)]
+    return [[k] if isinstance(k, str) else list(k) for k in keys]
+
+
+def run_dataset_checks(df: pd.DataFrame, dataset_rules: dict = None, contract_rules: dict = None) -> list:
+    """
+    Runs dataset-level contract rules.
+
+    Supported rules:
+        row_count_min (int), schema_match (bool), unique_key (column, list of columns, or list of such lists),
+        no_duplicate_rows (bool), column_comparisons (list of "a <= b" strings or {left, op, right} dicts).
+
+    Returns:
+        list: Result dictionaries with column "_dataset".
+    """
+    results = []
+    if not dataset_rules:
+        return results
+
+    def run(check_fn, *args):
+        started = time.perf_counter()
+        result = check_fn(*args)
+        result["duration_ms"] = (time.perf_counter() - started) * 1000
+        results.append(result)
+
+    if "row_count_min" in dataset_rules:
+        run(check_row_count_min, len(df), dataset_rules["row_count_min"])
+
+    if dataset_rules.get("schema_match") is True:
+        run(check_schema_match, dict(df.dtypes.items()), contract_rules)
+
+    for key_columns in normalize_key_sets(dataset_rules.get("unique_key")):
+        run(check_unique_key, df, key_columns)
+
+    if dataset_rules.get("no_duplicate_rows") is True and not df.empty:
+        run(check_duplicate_rows, df)
+
+    for rule in dataset_rules.get("column_comparisons", []) or []:
+        run(check_column_comparison, df, rule)
+
+    return results
@@ -0,0 +1,206 @@
+# dq_core/drift.py
+
+import os
+import re
+import time
+import numpy as np
+import pandas as pd
+from dq_core.contracts import DEFAULT_CONTRACT_PATH, save_contract, load_contract
+
+
+QUANTILE_BINS = 100
+TOP_K = 50
+PSI_MEDIUM = 0.1
+PSI_HIGH = 0.25
+KS_THRESHOLD = 0.1
+_EPS = 1e-4
+
+
+# ---------------------- Sketches ----------------------
+
+def numeric_sketch(series: pd.Series, bins: int = QUANTILE_BINS) -> dict:
+    """
+    Summarizes a numeric column as an equi-depth quantile sketch (bins + 1 cut points).
+    """
+    values = series.dropna()
+    sketch = {
+        "kind": "numeric",
+        "count": int(len(series)),
+        "null_ratio": round(float(series.isnull().mean()), 6) if len(series) else 0.0,
+        "quantiles": []
+    }
+    if not values.empty:
+        levels = np.linspace(0, 1, bins + 1)
+        sketch["quantiles"] = [float(q) for q in np.quantile(values.to_numpy(dtype="float64"), levels)]
+    return sketch
+
+
+def categorical_sketch(series: pd.Series, k: int = TOP_K) -> dict:
+    """
+    Summarizes a categorical column as the relative frequencies of its top-k values.
+    The remaining mass is implied as 1 - sum(frequencies).
+    """
+    values = series.dropna().astype(str)
+    freqs = values.value_counts(normalize=True).head(k) if not values.empty else pd.Series(dtype="float64")
+    return {
+        "kind": "categorical",
+        "count": int(len(series)),
+        "null_ratio": round(float(series.isnull().mean()), 6) if len(series) else 0.0,
+        "distinct": int(values.nunique()),
+        "top_k": {str(key): round(float(p), 6) for key, p in freqs.items()}
+    }
+
+
+def build_baseline(df: pd.DataFrame, dataset: str = None) -> dict:
+    """
+    Builds a compact per-column baseline for drift detection. Only the sketches are
+    kept, so the baseline data never needs to be stored or reloaded. The dataset
+    name is stored with the sketches so a baseline is never applied to another dataset.
+    """
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if series.dtype.kind in "iuf":
+            columns[str(col)] = numeric_sketch(series)
+        elif series.dtype.kind in "bOSU" or isinstance(series.dtype, (pd.CategoricalDtype, pd.StringDtype)):
+            columns[str(col)] = categorical_sketch(series)
+    return {
+        "dataset": dataset,
+        "created_at": time.time(),
+        "row_count": int(len(df)),
+        "columns": columns
+    }
+
+
+# ---------------------- Persistence ----------------------
+
+def baseline_path_for(contract_path: str = DEFAULT_CONTRACT_PATH, dataset: str = None) -> str:
+    """
+    Returns the baseline file path stored next to a contract file, one per dataset name.
+    """
+    root, _ = os.path.splitext(contract_path)
+    if dataset:
+        return f"{root}.{re.sub(r'[^A-Za-z0-9_.-]+', '_', dataset)}.baseline.json"
+    return f"{root}.baseline.json"
+
+
+def save_baseline(baseline: dict, contract_path: str = DEFAULT_CONTRACT_PATH) -> None:
+    save_contract(baseline, baseline_path_for(contract_path, baseline.get("dataset")))
+
+
+def load_baseline(contract_path: str = DEFAULT_CONTRACT_PATH, dataset: str = None) -> dict:
+    """
+    Loads the baseline saved for a dataset. Returns {} when none exists, or when the
+    file belongs to a different dataset (e.g. two names that map to the same file).
+    """
+    baseline = load_contract(baseline_path_for(contract_path, dataset))
+    if baseline and baseline.get("dataset") != dataset:
+        print(f"[Drift] ⚠️ Baseline belongs to `{baseline.get('dataset')}`, not `{dataset}`; ignoring it.")
+        return {}
+    return baseline
+
+
+# ---------------------- Scores ----------------------
+
+def _psi(expected: np.ndarray, actual: np.ndarray) -> float:
+    expected = np.clip(expected, _EPS, None)
+    actual = np.clip(actual, _EPS, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def compare_numeric(sketch: dict, series: pd.Series) -> dict:
+    """
+    Computes PSI and KS between a numeric baseline sketch and new data.
+
+    The baseline CDF is read off the quantile cut points (merging repeated points
+    so point masses are kept), and the new CDF is evaluated at the same points.
+    """
+    quantiles = np.asarray(sketch.get("quantiles", []), dtype="float64")
+    values = np.sort(series.dropna().to_numpy(dtype="float64"))
+    if quantiles.size == 0 or values.size == 0:
+        return {"psi": 0.0, "ks": 0.0}
+
+    levels = np.linspace(0, 1, quantiles.size)
+    edges, last_idx = np.unique(quantiles[::-1], return_index=True)
+    base_cdf = levels[::-1][last_idx]
+    new_cdf = np.searchsorted(values, edges, side="right") / values.size
+
+    # Bins: (-inf, e0], (e0, e1], ..., (e_last, inf)
+    expected = np.diff(np.concatenate([[0.0], base_cdf, [1.0]]))
+    actual = np.diff(np.concatenate([[0.0], new_cdf, [1.0]]))
+    return {
+        "psi": round(_psi(expected, actual), 4),
+        "ks": round(float(np.max(np.abs(new_cdf - base_cdf))), 4)
+    }
+
+
+def compare_categorical(sketch: dict, series: pd.Series) -> dict:
+    """
+    Computes PSI between a top-k frequency sketch and new data over the top-k
+    categories plus an "other" bucket.
+    """
+    top_k = sketch.get("top_k", {})
+    values = series.dropna().astype(str)
+    if not top_k or values.empty:
+        return {"psi": 0.0, "ks": None}
+
+    keys = list(top_k.keys())
+    expected = np.array([top_k[key] for key in keys] + [max(0.0, 1 - sum(top_k.values()))])
+    new_freqs = values.value_counts(normalize=True)
+    actual_top = new_freqs.reindex(keys, fill_value=0.0).to_numpy()
+    actual = np.concatenate([actual_top, [max(0.0, 1 - actual_top.sum())]])
+    return {"psi": round(_psi(expected, actual), 4), "ks": None}
+
+
+def detect_drift(df: pd.DataFrame, baseline: dict, psi_threshold: float = PSI_MEDIUM) -> list:
+    """
+    Compares new data against a saved baseline.
+
+    Args:
+        df (pd.DataFrame): New data.
+        baseline (dict): Output of build_baseline (or load_baseline).
+        psi_threshold (float): Minimum PSI required to flag a column.
+
+    Returns:
+        List of drift dictionaries for flagged columns.
+    """
+    drifts = []
+
+    for col, sketch in baseline.get("columns", {}).items():
+        if col not in df.columns:
+            continue
+
+        series = df[col]
+        if sketch["kind"] == "numeric":
+            if series.dtype.kind not in "iuf":
+                continue
+            scores = compare_numeric(sketch, series)
+        else:
+            scores = compare_categorical(sketch, series)
+
+        ks = scores["ks"]
+        if scores["psi"] < psi_threshold and (ks is None or ks < KS_THRESHOLD):
+            continue
+
+        severity = (
+            "high" if scores["psi"] >= PSI_HIGH else
+            "medium" if scores["psi"] >= PSI_MEDIUM else
+            "low"
+        )
+        issue = f"Distribution shifted from baseline (PSI {scores['psi']:.3f}"
+        issue += f", KS {ks:.3f})" if ks is not None else ")"
+
+        drifts.append({
+            "column": col,
+            "issue": issue,
+            "severity": severity,
+            "psi": scores["psi"],
+            "ks": ks,
+            "baseline_null_ratio": sketch.get("null_ratio"),
+            "null_ratio": round(float(series.isnull().mean()), 4) if len(series) else 0.0
+        })
+
+    severity_order = {"high": 0, "medium": 1, "low": 2}
+    drifts.sort(key=lambda x: (severity_order[x["severity"]], -x["psi"]))
+
+    return drifts
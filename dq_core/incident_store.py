@@ -0,0 +1,208 @@
+# dq_core/incident_store.py
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+DEFAULT_INCIDENT_DB_PATH = os.getenv("DQ_INCIDENT_DB", "incidents.db")
+DEFAULT_RETENTION_DAYS = 90
+DEFAULT_MAX_INCIDENTS = 100_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS incidents (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    dataset     TEXT NOT NULL,
+    type        TEXT NOT NULL,
+    column_name TEXT NOT NULL,
+    check_name  TEXT NOT NULL,
+    message     TEXT,
+    severity    TEXT,
+    occurrences INTEGER NOT NULL DEFAULT 1,
+    first_seen  REAL NOT NULL,
+    last_seen   REAL NOT NULL,
+    UNIQUE (dataset, type, column_name, check_name)
+);
+CREATE INDEX IF NOT EXISTS idx_incidents_last_seen ON incidents (last_seen DESC);
+CREATE INDEX IF NOT EXISTS idx_incidents_dataset ON incidents (dataset, last_seen DESC);
+CREATE INDEX IF NOT EXISTS idx_incidents_type ON incidents (type, last_seen DESC);
+"""
+
+_UPSERT = """
+INSERT INTO incidents (dataset, type, column_name, check_name, message, severity, occurrences, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)
+ON CONFLICT (dataset, type, column_name, check_name) DO UPDATE SET
+    occurrences = occurrences + 1,
+    message = excluded.message,
+    severity = excluded.severity,
+    last_seen = excluded.last_seen
+"""
+
+_FILTER_COLUMNS = {"dataset": "dataset", "type": "type", "column": "column_name", "check": "check_name"}
+
+
+class IncidentStore:
+    """
+    SQLite-backed incident log. Incidents are deduplicated by
+    (dataset, type, column, check) and keep an occurrence count with
+    first/last-seen timestamps, so repeated runs update one row instead of
+    appending a new one.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_INCIDENT_DB_PATH,
+        retention_days: Optional[float] = DEFAULT_RETENTION_DAYS,
+        max_incidents: Optional[int] = DEFAULT_MAX_INCIDENTS
+    ):
+        self.path = path
+        self.retention_days = retention_days
+        self.max_incidents = max_incidents
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    # ---------------------- Writes ----------------------
+
+    def record(self, incident: Dict, dataset: str = "default") -> None:
+        """
+        Records a single incident dict with keys type, column, check, message and severity.
+        """
+        self.record_many([incident], dataset)
+
+    def record_many(self, incidents: List[Dict], dataset: str = "default") -> None:
+        """
+        Records a batch of incidents in a single transaction.
+        """
+        if not incidents:
+            return
+        now = time.time()
+        rows = [
+            (
+                str(dataset),
+                str(i.get("type", "Unknown")),
+                str(i.get("column", "N/A")),
+                str(i.get("check", "")),
+                i.get("message"),
+                i.get("severity"),
+                now,
+                now
+            )
+            for i in incidents
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, rows)
+
+    def clear(self, dataset: Optional[str] = None) -> None:
+        """
+        Deletes all incidents, or only those of one dataset.
+        """
+        with self._lock, self._conn:
+            if dataset is None:
+                self._conn.execute("DELETE FROM incidents")
+            else:
+                self._conn.execute("DELETE FROM incidents WHERE dataset = ?", (dataset,))
+
+    def compact(self, vacuum: bool = True) -> int:
+        """
+        Applies retention: drops incidents not seen within retention_days and keeps at most
+        max_incidents of the most recently seen ones. Optionally reclaims file space.
+
+        Returns:
+            int: Number of incidents removed.
+        """
+        removed = 0
+        with self._lock:
+            with self._conn:
+                if self.retention_days is not None:
+                    cutoff = time.time() - self.retention_days * 86400
+                    removed += self._conn.execute(
+                        "DELETE FROM incidents WHERE last_seen < ?", (cutoff,)
+                    ).rowcount
+                if self.max_incidents is not None:
+                    removed += self._conn.execute(
+                        """
+                        DELETE FROM incidents WHERE id IN (
+                            SELECT id FROM incidents ORDER BY last_seen DESC LIMIT -1 OFFSET ?
+                        )
+                        """,
+                        (self.max_incidents,)
+                    ).rowcount
+            if vacuum and removed:
+                self._conn.execute("VACUUM")
+        return removed
+
+    # ---------------------- Reads ----------------------
+
+    def _where(self, filters: Dict) -> tuple:
+        clauses, params = [], []
+        for key, values in filters.items():
+            if not values:
+                continue
+            if isinstance(values, str):
+                values = [values]
+            clauses.append(f"{_FILTER_COLUMNS[key]} IN ({', '.join('?' * len(values))})")
+            params.extend(str(v) for v in values)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count(self, **filters) -> int:
+        """
+        Counts incidents matching the given filters (dataset, type, column, check).
+        """
+        where, params = self._where(filters)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM incidents{where}", params).fetchone()[0]
+
+    def query(self, limit: int = 50, offset: int = 0, **filters) -> List[Dict]:
+        """
+        Returns one page of incidents matching the filters, most recently seen first.
+        """
+        where, params = self._where(filters)
+        sql = (
+            "SELECT dataset, type, column_name AS column, check_name AS \"check\", message, severity, "
+            "occurrences, first_seen, last_seen "
+            f"FROM incidents{where} ORDER BY last_seen DESC LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, params + [int(limit), int(offset)]).fetchall()
+        return [dict(r) for r in rows]
+
+    def distinct(self, field: str, **filters) -> List[str]:
+        """
+        Returns the distinct values of one field (dataset, type, column, check).
+        """
+        where, params = self._where(filters)
+        col = _FILTER_COLUMNS[field]
+        with self._lock:
+            rows = self._conn.execute(f"SELECT DISTINCT {col} FROM incidents{where} ORDER BY {col}", params).fetchall()
+        return [r[0] for r in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_stores: Dict[str, IncidentStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_incident_store(path: str = DEFAULT_INCIDENT_DB_PATH) -> IncidentStore:
+    """
+    Returns the process-wide incident store for a path, opening it (and applying
+    retention) on first use.
+    """
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = IncidentStore(path)
+            try:
+                store.compact(vacuum=False)
+            except sqlite3.Error as e:
+                print(f"[Incident Store] ⚠️ Compaction failed: {e}")
+            _stores[path] = store
+        return store
@@ -0,0 +1,151 @@
+# dq_core/jobs.py
+
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+
+DEFAULT_MAX_WORKERS = 4
+FINISHED_JOB_LIMIT = 200
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when cancellation has been requested."""
+
+
+class Job:
+    """
+    A background job. The worker reports progress through `update`, which also
+    raises JobCancelled once cancellation has been requested.
+    """
+
+    def __init__(self, name: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.status = QUEUED
+        self.done = 0
+        self.total = 0
+        self.message = ""
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._cancel = threading.Event()
+
+    @property
+    def progress(self) -> float:
+        return self.done / self.total if self.total else (1.0 if self.finished else 0.0)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    def update(self, done: int, total: int, message: str = "") -> None:
+        """
+        Progress callback passed to the job function as `progress`.
+        """
+        if self._cancel.is_set():
+            raise JobCancelled()
+        self.done, self.total, self.message = done, total, message
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "progress": round(self.progress, 4),
+            "message": self.message,
+            "error": self.error,
+            "duration": round((self.finished_at or time.time()) - self.started_at, 2) if self.started_at else None
+        }
+
+
+class JobManager:
+    """
+    Runs job functions in a shared worker thread pool and keeps their results
+    keyed by job id, independently of any Streamlit script run.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dq-job")
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, name: str, fn: Callable, *args, **kwargs) -> Job:
+        """
+        Schedules fn(*args, progress=job.update, **kwargs) and returns its Job.
+        """
+        job = Job(name)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        self._pool.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def _run(self, job: Job, fn: Callable, args: tuple, kwargs: dict) -> None:
+        if job.cancel_requested:
+            job.status, job.finished_at = CANCELLED, time.time()
+            return
+        job.status, job.started_at = RUNNING, time.time()
+        try:
+            job.result = fn(*args, progress=job.update, **kwargs)
+            job.done = job.total
+            job.status = DONE
+        except JobCancelled:
+            job.status = CANCELLED
+        except Exception as e:
+            job.error = f"{e}"
+            job.status = FAILED
+            print(f"[Job Error] ❌ {job.name} ({job.id}): {traceback.format_exc()}")
+        finally:
+            job.finished_at = time.time()
+
+    def _prune(self) -> None:
+        finished = [j for j in self._jobs.values() if j.finished]
+        for job in sorted(finished, key=lambda j: j.finished_at or 0)[:max(0, len(finished) - FINISHED_JOB_LIMIT)]:
+            del self._jobs[job.id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self, job_ids: List[str]) -> List[Job]:
+        with self._lock:
+            return [self._jobs[j] for j in job_ids if j in self._jobs]
+
+    def cancel(self, job_id: str) -> None:
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """
+    Returns the process-wide job manager.
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+        return _manager
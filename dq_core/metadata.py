@@ -0,0 +1,175 @@
+# dq_core/metadata.py
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from dq_core.dataset_rules import check_row_count_min, check_schema_match
+
+
+CSV_TYPE_SAMPLE_ROWS = 1000
+NEWLINE_BUFFER_SIZE = 1 << 20
+DEFAULT_GATE_WORKERS = 16
+
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+ARROW_EXTENSIONS = (".arrow", ".feather", ".ipc")
+
+
+# ---------------------- Readers ----------------------
+
+def _count_csv_rows(path: str) -> int:
+    """
+    Counts data rows by counting newlines in binary blocks. Quoted fields that
+    contain newlines are counted as extra rows.
+    """
+    lines = 0
+    last = b""
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(NEWLINE_BUFFER_SIZE)
+            if not block:
+                break
+            lines += block.count(b"\n")
+            last = block
+    if last and not last.endswith(b"\n"):
+        lines += 1
+    return max(0, lines - 1)  # header
+
+
+def read_csv_metadata(path: str) -> dict:
+    """
+    Reads CSV metadata from the header (types inferred from the first rows) and a newline count.
+    """
+    head = pd.read_csv(path, nrows=CSV_TYPE_SAMPLE_ROWS, low_memory=False)
+    return {
+        "row_count": _count_csv_rows(path),
+        "columns": dict(head.dtypes.items())
+    }
+
+
+def read_parquet_metadata(path: str) -> dict:
+    """
+    Reads row count and schema from the Parquet footer only.
+    """
+    import pyarrow.parquet as pq
+    meta = pq.read_metadata(path)
+    schema = meta.schema.to_arrow_schema()
+    return {
+        "row_count": int(meta.num_rows),
+        "columns": {field.name: field.type for field in schema}
+    }
+
+
+def read_arrow_metadata(path: str) -> dict:
+    """
+    Reads the schema and record batch lengths of an Arrow IPC / Feather v2 file
+    through a memory map, without touching the column buffers.
+    """
+    import pyarrow as pa
+    with pa.memory_map(path, "r") as source:
+        reader = pa.ipc.open_file(source)
+        row_count = sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+        return {
+            "row_count": int(row_count),
+            "columns": {field.name: field.type for field in reader.schema}
+        }
+
+
+def read_file_metadata(path: str) -> dict:
+    """
+    Reads row count and column types for a CSV, Parquet or Arrow IPC file without loading row data.
+    """
+    lower = str(path).lower()
+    if lower.endswith(PARQUET_EXTENSIONS):
+        return read_parquet_metadata(path)
+    if lower.endswith(ARROW_EXTENSIONS):
+        return read_arrow_metadata(path)
+    return read_csv_metadata(path)
+
+
+def read_snowflake_metadata(conn, database: str, schema: str, table: str) -> dict:
+    """
+    Reads column types and the row count for a Snowflake table from INFORMATION_SCHEMA.
+
+    Args:
+        conn: An open snowflake.connector connection.
+    """
+    cur = conn.cursor()
+    try:
+        cur.execute(
+            f"SELECT COLUMN_NAME, DATA_TYPE FROM {database}.INFORMATION_SCHEMA.COLUMNS "
+            "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s ORDER BY ORDINAL_POSITION",
+            (schema.upper(), table.upper())
+        )
+        columns = {name: data_type for name, data_type in cur.fetchall()}
+        cur.execute(
+            f"SELECT ROW_COUNT FROM {database}.INFORMATION_SCHEMA.TABLES "
+            "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s",
+            (schema.upper(), table.upper())
+        )
+        row = cur.fetchone()
+    finally:
+        cur.close()
+    return {
+        "row_count": int(row[0]) if row and row[0] is not None else None,
+        "columns": columns
+    }
+
+
+# ---------------------- Checks ----------------------
+
+def run_metadata_checks(metadata: dict, dataset_rules: dict = None, contract_rules: dict = None) -> list:
+    """
+    Answers the row_count_min and schema_match dataset rules from metadata alone.
+    Other dataset rules need row data and are skipped. A row_count_min rule fails
+    when the metadata carries no row count (e.g. Snowflake views), so the gate
+    never passes a rule it could not evaluate.
+    """
+    results = []
+    if not dataset_rules:
+        return results
+
+    if "row_count_min" in dataset_rules:
+        if metadata.get("row_count") is not None:
+            results.append(check_row_count_min(metadata["row_count"], dataset_rules["row_count_min"]))
+        else:
+            results.append({
+                "check": "Dataset: Row Count Minimum",
+                "status": "FAIL",
+                "column": "_dataset",
+                "message": f"Row count not available from metadata. Minimum expected: {dataset_rules['row_count_min']}.",
+                "severity": "high",
+                "lower_bound": dataset_rules["row_count_min"]
+            })
+
+    if dataset_rules.get("schema_match") is True:
+        results.append(check_schema_match(metadata.get("columns", {}), contract_rules))
+
+    return results
+
+
+def run_metadata_gate(
+    paths: list,
+    dataset_rules: dict = None,
+    contract_rules: dict = None,
+    max_workers: int = DEFAULT_GATE_WORKERS
+) -> dict:
+    """
+    Runs metadata-only checks on many files concurrently.
+
+    Returns:
+        dict: path -> list of results. Unreadable files get a single failing result.
+    """
+    def gate(path):
+        try:
+            return run_metadata_checks(read_file_metadata(path), dataset_rules, contract_rules)
+        except Exception as e:
+            return [{
+                "check": "Dataset: Metadata",
+                "status": "FAIL",
+                "column": "_dataset",
+                "message": f"Could not read metadata for {os.path.basename(str(path))}: {e}",
+                "severity": "high"
+            }]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(paths, pool.map(gate, paths)))
@@ -1,7 +1,153 @@
 # dq_core/profiler.py
 
+import string
+import warnings
+import numpy as np
 import pandas as pd
 
+PATTERN_TOP_N = 10
+PATTERN_MAX_LENGTH = 64
+SEMANTIC_MAX_DISTINCT = 20_000
+SEMANTIC_MIN_RATIO = 0.9
+DATETIME_SAMPLE_SIZE = 200
+
+# Character-class translation: uppercase -> A, lowercase -> a, digits -> 9
+_SHAPE_TABLE = str.maketrans(
+    string.ascii_uppercase + string.ascii_lowercase + string.digits,
+    "A" * 26 + "a" * 26 + "9" * 10
+)
+
+_SEMANTIC_REGEXES = {
+    "email": r"[^@\s]+@[^@\s]+\.[A-Za-z]{2,}",
+    "uuid": r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}",
+    "url": r"https?://\S+",
+}
+
+
+def shape_signatures(values: pd.Series) -> pd.Series:
+    """
+    Maps each string to its character-class shape, e.g. "AB1234" -> "AA9999".
+    Long values are truncated to PATTERN_MAX_LENGTH characters.
+    """
+    return values.str.slice(0, PATTERN_MAX_LENGTH).str.translate(_SHAPE_TABLE)
+
+
+def signature_to_regex(signature: str) -> str:
+    """
+    Converts a shape signature into a regex, e.g. "AA-9999" -> "^[A-Z]{2}\\-\\d{4}$".
+    """
+    classes = {"A": "[A-Z]", "a": "[a-z]", "9": "\\d"}
+    parts = []
+    i = 0
+    while i < len(signature):
+        ch = signature[i]
+        run = 1
+        while i + run < len(signature) and signature[i + run] == ch:
+            run += 1
+        token = classes.get(ch, "\\" + ch if not ch.isalnum() else ch)
+        parts.append(token if run == 1 else f"{token}{{{run}}}")
+        i += run
+    return "^" + "".join(parts) + "$"
+
+
+def _parse_datetimes(values: pd.Series, mixed: bool) -> np.ndarray:
+    """
+    Returns a mask of values that parse as datetimes. Everything is parsed to UTC so
+    mixed offsets and naive stamps do not raise; any other parse error means "not a datetime".
+    """
+    try:
+        with warnings.catch_warnings():
+            # format=None warns when it falls back to per-element inference
+            warnings.simplefilter("ignore", UserWarning)
+            parsed = pd.to_datetime(values, errors="coerce", utc=True, format="mixed" if mixed else None)
+        return np.array(parsed.notna(), dtype=bool)
+    except (ValueError, TypeError, OverflowError):
+        return np.zeros(len(values), dtype=bool)
+
+
+def datetime_mask(values: pd.Series) -> np.ndarray:
+    """
+    Flags distinct values that parse as datetimes.
+
+    A bounded sample of the most frequent values is parsed first, so free-text
+    columns are rejected without parsing every distinct value. Otherwise one
+    vectorized parse with the inferred format runs over all values, and only
+    the values it misses are parsed element by element.
+    """
+    sample = values.head(DATETIME_SAMPLE_SIZE)
+    sample_mask = _parse_datetimes(sample, mixed=True)
+    if not len(sample_mask) or sample_mask.mean() < SEMANTIC_MIN_RATIO:
+        return np.concatenate([sample_mask, np.zeros(len(values) - len(sample), dtype=bool)])
+
+    mask = _parse_datetimes(values, mixed=False)
+    missed = np.flatnonzero(~mask)
+    if missed.size:
+        mask[missed] = _parse_datetimes(values.iloc[missed], mixed=True)
+    return mask
+
+
+def profile_patterns(series: pd.Series, top_n: int = PATTERN_TOP_N) -> dict:
+    """
+    Profiles a text column: semantic type and character-class shape frequencies.
+
+    All work is done on the distinct values (weighted by their counts), using
+    vectorized parse attempts and string translation, so cost scales with the
+    number of distinct values rather than the number of rows.
+
+    Returns:
+        dict: semantic_type, semantic_ratio, patterns (top shapes with counts), pattern_coverage
+              and suggested_regex (when the top shape covers most values).
+    """
+    counts = series.dropna().astype(str).value_counts()
+    total = int(counts.sum())
+    if total == 0:
+        return {"semantic_type": None, "semantic_ratio": 0.0, "patterns": [], "pattern_coverage": 0.0}
+
+    # --- Shape signatures ---
+    shapes = shape_signatures(counts.index.to_series()).to_numpy()
+    shape_counts = counts.groupby(shapes).sum().sort_values(ascending=False)
+    top_shapes = shape_counts.head(top_n)
+    patterns = [
+        {"pattern": shape, "count": int(n), "ratio": round(n / total, 4)}
+        for shape, n in top_shapes.items()
+    ]
+
+    # --- Semantic type (parse attempts on the most frequent distinct values) ---
+    distinct = counts.head(SEMANTIC_MAX_DISTINCT)
+    values = distinct.index.to_series()
+    weights = distinct.to_numpy()
+    weight_total = weights.sum()
+
+    candidates = {
+        "numeric": pd.to_numeric(values, errors="coerce").notna().to_numpy(),
+        "boolean": values.str.lower().isin(["true", "false", "yes", "no", "y", "n", "t", "f"]).to_numpy(),
+    }
+    for name, regex in _SEMANTIC_REGEXES.items():
+        candidates[name] = values.str.fullmatch(regex).to_numpy()
+    if not candidates["numeric"].all():
+        candidates["datetime"] = datetime_mask(values)
+
+    semantic_type, semantic_ratio = "text", 0.0
+    for name in ("uuid", "email", "url", "boolean", "numeric", "datetime"):
+        if name not in candidates:
+            continue
+        ratio = float(weights[candidates[name]].sum() / weight_total)
+        if ratio >= SEMANTIC_MIN_RATIO:
+            semantic_type, semantic_ratio = name, ratio
+            break
+
+    profile = {
+        "semantic_type": semantic_type,
+        "semantic_ratio": round(semantic_ratio, 4),
+        "distinct_count": int(len(counts)),
+        "patterns": patterns,
+        "pattern_coverage": round(float(top_shapes.sum() / total), 4)
+    }
+    if patterns and patterns[0]["ratio"] >= SEMANTIC_MIN_RATIO and len(patterns[0]["pattern"]) < PATTERN_MAX_LENGTH:
+        profile["suggested_regex"] = signature_to_regex(patterns[0]["pattern"])
+    return profile
+
+
 def profile_dataframe(df: pd.DataFrame) -> dict:
     """
     Profiles the DataFrame and returns summary stats useful for AI and validation checks.
@@ -23,7 +169,7 @@ def profile_dataframe(df: pd.DataFrame) -> dict:
         col_profile = {
             "dtype": str(series.dtype),
             "null_ratio": round(series.isnull().mean(), 4),
-            "unique_ratio": round(series.nunique(dropna=True) / len(series), 4)
+            "unique_ratio": round(series.nunique(dropna=True) / len(series), 4) if len(series) else 0.0
         }
 
         if series.dtype.kind in "iufc":  # Numeric
@@ -33,9 +179,10 @@ def profile_dataframe(df: pd.DataFrame) -> dict:
                 "mean": round(series.mean(), 2),
                 "std_dev": round(series.std(), 2)
             })
-        elif series.dtype == object:
+        elif series.dtype == object or isinstance(series.dtype, pd.StringDtype):
             sample = series.dropna().astype(str)
             col_profile["sample_values"] = sample.sample(min(5, len(sample))).tolist() if not sample.empty else []
+            col_profile.update(profile_patterns(series))
 
         profile["columns"][col] = col_profile
 
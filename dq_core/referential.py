@@ -0,0 +1,248 @@
+# dq_core/referential.py
+
+import math
+import os
+import threading
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+DEFAULT_EXPECTED_KEYS = 10_000_000
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+SAMPLE_LIMIT = 5
+BLOOM_CACHE_LIMIT = 8
+CSV_SIZE_SAMPLE_BYTES = 1 << 20
+CSV_ESTIMATE_MARGIN = 1.2
+
+_HASH_KEY_1 = "0123456789123456"
+_HASH_KEY_2 = "dq-ref-integrity"
+
+
+# ---------------------- Key Normalization ----------------------
+
+def normalize_keys(series: pd.Series) -> pd.Series:
+    """
+    Normalizes key values to strings so that parent and child keys compare equal
+    regardless of how each file was typed (e.g. 42, 42.0 and "42").
+    """
+    series = series.dropna()
+    if series.dtype.kind == "f":
+        # Element-wise, so a key's identity never depends on the other values in its chunk
+        values = series.to_numpy()
+        integral = np.isfinite(values) & (values == np.floor(values)) & (np.abs(values) < 2 ** 63)
+        keys = series.astype(str)
+        keys[integral] = values[integral].astype("int64").astype(str)
+        return keys
+    return series.astype(str)
+
+
+def _hash_pair(keys: pd.Series) -> tuple:
+    h1 = pd.util.hash_pandas_object(keys, index=False, hash_key=_HASH_KEY_1).to_numpy()
+    h2 = pd.util.hash_pandas_object(keys, index=False, hash_key=_HASH_KEY_2).to_numpy() | np.uint64(1)
+    return h1, h2
+
+
+# ---------------------- Bloom Filter ----------------------
+
+class BloomFilter:
+    """
+    Vectorized Bloom filter over string keys. Bit positions come from double
+    hashing of two 64-bit pandas hashes, so whole chunks are added or probed
+    with numpy operations.
+    """
+
+    def __init__(self, expected_items: int, false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE):
+        expected_items = max(1, int(expected_items))
+        self.num_bits = max(64, int(math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / expected_items * math.log(2))))
+        self.bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+
+    def _positions(self, keys: pd.Series):
+        h1, h2 = _hash_pair(keys)
+        m = np.uint64(self.num_bits)
+        for i in range(self.num_hashes):
+            yield (h1 + np.uint64(i) * h2) % m
+
+    def add(self, keys: pd.Series) -> None:
+        for pos in self._positions(keys):
+            np.bitwise_or.at(self.bits, (pos >> np.uint64(3)).astype(np.int64), (np.uint8(1) << (pos & np.uint64(7)).astype(np.uint8)))
+
+    def contains(self, keys: pd.Series) -> np.ndarray:
+        present = np.ones(len(keys), dtype=bool)
+        for pos in self._positions(keys):
+            byte = self.bits[(pos >> np.uint64(3)).astype(np.int64)]
+            present &= (byte >> (pos & np.uint64(7)).astype(np.uint8)) & np.uint8(1) == 1
+        return present
+
+    @property
+    def memory_bytes(self) -> int:
+        return int(self.bits.nbytes)
+
+
+# ---------------------- Parent Sources ----------------------
+
+def iter_key_chunks(source, column: str, chunksize: int = DEFAULT_CHUNK_SIZE):
+    """
+    Streams one key column of a parent dataset in chunks of normalized keys.
+
+    Args:
+        source: A DataFrame, or a path to a CSV or Parquet file.
+        column (str): Key column in the parent dataset.
+        chunksize (int): Rows per chunk.
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield normalize_keys(source[column].iloc[start:start + chunksize])
+        return
+
+    path = str(source)
+    if path.lower().endswith((".parquet", ".pq")):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=[column]):
+            yield normalize_keys(batch.column(0).to_pandas())
+    else:
+        with pd.read_csv(path, usecols=[column], chunksize=chunksize, low_memory=False) as reader:
+            for chunk in reader:
+                yield normalize_keys(chunk[column])
+
+
+def _estimate_csv_rows(path: str) -> int:
+    """
+    Estimates a CSV's row count from its file size and the bytes per row of a sample
+    from the start of the file, with a safety margin so the filter is not undersized.
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        sample = f.read(CSV_SIZE_SAMPLE_BYTES)
+    lines = sample.count(b"\n")
+    if len(sample) >= size:
+        return max(1, lines)
+    if lines < 2:
+        return DEFAULT_EXPECTED_KEYS
+    return int(size / (len(sample) / lines) * CSV_ESTIMATE_MARGIN)
+
+
+def _estimate_keys(source) -> int:
+    if isinstance(source, pd.DataFrame):
+        return len(source)
+    path = str(source)
+    if path.lower().endswith((".parquet", ".pq")):
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).metadata.num_rows
+    return _estimate_csv_rows(path)
+
+
+_bloom_cache = {}
+_bloom_cache_lock = threading.Lock()
+
+
+def build_bloom_filter(source, column: str, false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE) -> BloomFilter:
+    """
+    Builds (or reuses) a Bloom filter over a parent file's key column.
+    Filters are cached per file path, column and modification time.
+    """
+    cache_key = None
+    if not isinstance(source, pd.DataFrame):
+        stat = os.stat(source)
+        cache_key = (os.path.abspath(source), column, stat.st_mtime_ns, stat.st_size, false_positive_rate)
+        with _bloom_cache_lock:
+            if cache_key in _bloom_cache:
+                return _bloom_cache[cache_key]
+
+    bloom = BloomFilter(_estimate_keys(source), false_positive_rate)
+    for keys in iter_key_chunks(source, column):
+        bloom.add(keys)
+
+    if cache_key is not None:
+        with _bloom_cache_lock:
+            while len(_bloom_cache) >= BLOOM_CACHE_LIMIT:
+                _bloom_cache.pop(next(iter(_bloom_cache)))
+            _bloom_cache[cache_key] = bloom
+    return bloom
+
+
+# ---------------------- Integrity Check ----------------------
+
+def find_missing_references(child: pd.Series, source, column: str) -> pd.Index:
+    """
+    Returns the distinct child key values that do not exist in the parent key column.
+
+    In-memory parents are probed through a hashed key index. File parents are
+    streamed twice: once into a Bloom filter (cached), and once to confirm the
+    Bloom positives exactly, so only the child's candidate keys are ever held
+    in memory.
+    """
+    child_keys = pd.Index(normalize_keys(child).unique())
+    if child_keys.empty:
+        return child_keys
+
+    if isinstance(source, pd.DataFrame):
+        parent_keys = pd.Index(normalize_keys(source[column]).unique())
+        return child_keys[~child_keys.isin(parent_keys)]
+
+    bloom = build_bloom_filter(source, column)
+    maybe_present = bloom.contains(child_keys.to_series())
+    missing = child_keys[~maybe_present]
+    candidates = child_keys[maybe_present]
+
+    if len(candidates):
+        found = np.zeros(len(candidates), dtype=bool)
+        for keys in iter_key_chunks(source, column):
+            found |= candidates.isin(keys)
+            if found.all():
+                break
+        missing = missing.append(candidates[~found])
+
+    return missing
+
+
+def check_references(series: pd.Series, reference: dict, reference_data: dict = None) -> dict:
+    """
+    Runs the `references: {dataset, column}` contract rule for one child column.
+
+    The parent dataset is looked up by name in reference_data (name -> DataFrame);
+    otherwise `dataset` is treated as a CSV/Parquet file path.
+    """
+    dataset = reference.get("dataset")
+    parent_col = reference.get("column")
+    target = f"{dataset}.{parent_col}"
+    source = (reference_data or {}).get(dataset, dataset)
+
+    try:
+        if isinstance(source, pd.DataFrame) and parent_col not in source.columns:
+            raise KeyError(f"column `{parent_col}` not in `{dataset}`")
+        if not isinstance(source, pd.DataFrame) and not os.path.exists(str(source)):
+            raise FileNotFoundError(f"reference dataset `{dataset}` not found")
+        missing = find_missing_references(series, source, parent_col)
+    except Exception as e:
+        return {
+            "column": series.name,
+            "check": "Contract - References",
+            "status": "FAIL",
+            "message": f"Could not check references to {target}: {e}",
+            "severity": "high"
+        }
+
+    if missing.empty:
+        return {
+            "column": series.name,
+            "check": "Contract - References",
+            "status": "PASS",
+            "message": f"All values exist in {target}",
+            "severity": "low",
+            "failed_count": 0,
+            "total_count": int(series.notna().sum())
+        }
+
+    orphan_rows = int(normalize_keys(series).isin(missing).sum())
+    return {
+        "column": series.name,
+        "check": "Contract - References",
+        "status": "FAIL",
+        "message": f"{orphan_rows} values ({len(missing)} distinct) not found in {target}",
+        "severity": "high",
+        "failed_count": orphan_rows,
+        "total_count": int(series.notna().sum()),
+        "sample_keys": missing[:SAMPLE_LIMIT].tolist()
+    }
@@ -0,0 +1,158 @@
+# dq_core/results.py
+
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+
+DEFAULT_RESULTS_DIR = os.getenv("DQ_RESULTS_DIR", "dq_results")
+
+RESULT_SCHEMA = pa.schema([
+    ("run_id", pa.string()),
+    ("run_at", pa.timestamp("us", tz="UTC")),
+    ("dataset", pa.string()),
+    ("source", pa.string()),
+    ("column", pa.string()),
+    ("check", pa.string()),
+    ("status", pa.string()),
+    ("severity", pa.string()),
+    ("failed_count", pa.int64()),
+    ("total_count", pa.int64()),
+    ("ratio", pa.float64()),
+    ("lower_bound", pa.float64()),
+    ("upper_bound", pa.float64()),
+    ("value", pa.float64()),
+    ("duration_ms", pa.float64()),
+    ("message", pa.string()),
+])
+
+_INT_FIELDS = ("failed_count", "total_count")
+_FLOAT_FIELDS = ("ratio", "lower_bound", "upper_bound", "value", "duration_ms")
+
+
+def _normalize(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Maps the result columns of the rule engine, dataset rules, anomaly scan and drift
+    detection onto the shared metric fields, column by column.
+    """
+    frame = frame.reindex(columns=frame.columns.union(RESULT_SCHEMA.names + ["outlier_count", "bounds", "psi", "issue"], sort=False))
+    frame["failed_count"] = frame["failed_count"].fillna(frame["outlier_count"])
+    total = pd.to_numeric(frame["total_count"], errors="coerce")
+    frame["ratio"] = frame["ratio"].fillna(pd.to_numeric(frame["outlier_count"], errors="coerce") / total.where(total > 0))
+    bounds = frame["bounds"].dropna()
+    if not bounds.empty:
+        bounds = bounds[bounds.str.len() == 2]
+        frame["lower_bound"] = frame["lower_bound"].fillna(bounds.str[0])
+        frame["upper_bound"] = frame["upper_bound"].fillna(bounds.str[1])
+    frame["value"] = frame["value"].fillna(frame["psi"])
+
+    is_finding = frame["issue"].notna()
+    frame["message"] = frame["message"].fillna(frame["issue"])
+    finding_check = pd.Series(np.where(frame["psi"].notna(), "Drift", "Anomaly"), index=frame.index)
+    frame["check"] = frame["check"].fillna(finding_check.where(is_finding))
+    frame["status"] = frame["status"].fillna(pd.Series("FAIL", index=frame.index).where(is_finding))
+    return frame
+
+
+def results_to_arrow(results: list, dataset: str = None, source: str = "checks", run_id: str = None) -> pa.Table:
+    """
+    Converts result dicts into a typed, columnar Arrow table (RESULT_SCHEMA). Numeric metrics
+    are kept in their own columns, separate from the display message.
+    """
+    if not results:
+        return RESULT_SCHEMA.empty_table()
+
+    frame = _normalize(pd.DataFrame.from_records(results))
+    frame["run_id"] = run_id or uuid.uuid4().hex
+    frame["run_at"] = pd.Timestamp(datetime.now(timezone.utc)).as_unit("us")
+    frame["dataset"] = dataset
+    frame["source"] = source
+
+    for field in ("run_id", "dataset", "source", "column", "check", "status", "severity", "message"):
+        frame[field] = frame[field].astype("string")
+    # Non-numeric values (e.g. strings) become nulls; integer fields are truncated like int()
+    for field in _INT_FIELDS:
+        frame[field] = np.trunc(pd.to_numeric(frame[field], errors="coerce")).astype("Int64")
+    for field in _FLOAT_FIELDS:
+        frame[field] = pd.to_numeric(frame[field], errors="coerce").astype("float64")
+
+    table = pa.Table.from_pandas(frame[RESULT_SCHEMA.names], schema=RESULT_SCHEMA, preserve_index=False)
+    return table.replace_schema_metadata(RESULT_SCHEMA.metadata)
+
+
+def build_exports(table: pa.Table) -> dict:
+    """
+    Serializes a results table to Parquet bytes and JSONL text once, for download buttons.
+    """
+    return {"parquet": results_to_parquet_bytes(table), "jsonl": results_to_jsonl(table)}
+
+
+# ---------------------- Export ----------------------
+
+def write_results(table: pa.Table, path: str) -> None:
+    """
+    Writes a results table to a .parquet or .jsonl file.
+    """
+    if str(path).lower().endswith(".jsonl"):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(results_to_jsonl(table))
+    else:
+        pq.write_table(table, path)
+
+
+def results_to_parquet_bytes(table: pa.Table) -> bytes:
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink)
+    return sink.getvalue().to_pybytes()
+
+
+def results_to_jsonl(table: pa.Table) -> str:
+    return table.to_pandas().to_json(orient="records", lines=True, date_format="iso")
+
+
+def append_results(table: pa.Table, results_dir: str = DEFAULT_RESULTS_DIR) -> str:
+    """
+    Appends a results table to a Parquet results dataset (one file per run, partitioned by day).
+
+    Returns:
+        str: Path of the written file.
+    """
+    day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    part_dir = os.path.join(results_dir, f"run_date={day}")
+    os.makedirs(part_dir, exist_ok=True)
+    path = os.path.join(part_dir, f"part-{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}.parquet")
+    pq.write_table(table, path)
+    return path
+
+
+def read_results(results_dir: str = DEFAULT_RESULTS_DIR, filter_expression=None) -> pa.Table:
+    """
+    Reads the results dataset, optionally filtered with a pyarrow.compute expression
+    (e.g. pc.field("status") == "FAIL").
+    """
+    if not os.path.isdir(results_dir):
+        return RESULT_SCHEMA.empty_table()
+    dataset = ds.dataset(results_dir, format="parquet", partitioning="hive")
+    return dataset.to_table(filter=filter_expression)
+
+
+def summarize_results(table: pa.Table, by: tuple = ("dataset", "check")) -> pa.Table:
+    """
+    Aggregates results with Arrow's group_by: run counts, failures and mean failure ratio.
+    """
+    failed = pc.cast(pc.equal(table["status"], "FAIL"), pa.int64())
+    table = table.append_column("is_failed", failed)
+    return table.group_by(list(by)).aggregate([
+        ("run_id", "count_distinct"),
+        ("is_failed", "sum"),
+        ("failed_count", "sum"),
+        ("ratio", "mean"),
+        ("duration_ms", "mean"),
+    ])
@@ -1,135 +1,562 @@
 # dq_core/rule_engine.py
 
+import time
+from functools import cached_property
+import numpy as np
 import pandas as pd
 import re
+from dq_core.referential import check_references
+from dq_core.dataset_rules import (
+    find_duplicate_rows, check_row_count_min, check_schema_match, check_column_comparison,
+    normalize_key_sets
+)
 
-def run_basic_checks(df: pd.DataFrame, contract_rules: dict = None):
+GATE_BLOCK_SIZE = 65_536
+
+# ---------------------- Column Context ----------------------
+
+class ColumnContext:
+    """
+    Per-column intermediates shared by all registered checks. Each one is computed
+    at most once per column, so adding checks that reuse them adds no extra scans.
+
+    Available: series, contract, reference_data, total_len, is_numeric, null_mask,
+    null_ratio, non_null, value_counts (non-null values), nunique, unique_ratio, str_values
+    (distinct non-null values as strings, aligned with value_counts).
+    """
+
+    def __init__(self, col, series: pd.Series, contract: dict, reference_data: dict = None):
+        self.column = col
+        self.series = series
+        self.contract = contract
+        self.reference_data = reference_data
+        self.total_len = len(series)
+        self.is_numeric = series.dtype.kind in "iufc"
+
+    @cached_property
+    def null_mask(self) -> pd.Series:
+        return self.series.isnull()
+
+    @cached_property
+    def null_ratio(self) -> float:
+        return self.null_mask.mean()
+
+    @cached_property
+    def non_null(self) -> pd.Series:
+        return self.series[~self.null_mask]
+
+    @cached_property
+    def value_counts(self) -> pd.Series:
+        return self.non_null.value_counts(sort=False)
+
+    @cached_property
+    def nunique(self) -> int:
+        return len(self.value_counts)
+
+    @cached_property
+    def unique_ratio(self) -> float:
+        return self.nunique / self.total_len if self.total_len else 0
+
+    @cached_property
+    def str_values(self) -> pd.Series:
+        return self.value_counts.index.to_series().astype(str).reset_index(drop=True)
+
+    def count_of(self, distinct_mask) -> int:
+        """
+        Number of non-null rows whose distinct value is flagged in distinct_mask.
+        """
+        return int(self.value_counts.to_numpy()[np.asarray(distinct_mask, dtype=bool)].sum())
+
+    def ratio_of(self, distinct_mask) -> float:
+        """
+        Share of non-null rows whose distinct value is flagged in distinct_mask.
+        """
+        total = len(self.non_null)
+        return self.count_of(distinct_mask) / total if total else 0.0
+
+    def result(self, check: str, status: str, message: str, severity: str, **metrics) -> dict:
+        """
+        Builds a result dict. Numeric metrics (failed_count, total_count, ratio, lower_bound,
+        upper_bound, value) are kept as separate fields next to the display message.
+        """
+        return {
+            "column": self.column,
+            "check": check,
+            "status": status,
+            "message": message,
+            "severity": severity,
+            **metrics
+        }
+
+
+# ---------------------- Check Registry ----------------------
+
+CHECK_REGISTRY = []
+
+
+ALL_SEVERITIES = ("low", "medium", "high")
+
+
+def register_check(
+    name: str,
+    needs: tuple = (),
+    applies=None,
+    severities: tuple = ALL_SEVERITIES,
+    cost: int = 10,
+    gate=None
+):
+    """
+    Registers a column check. Usage:
+
+        @register_check("Contract - Allowed Values", needs=("value_counts",), applies=lambda c: "allowed_values" in c)
+        def allowed_values(ctx): ...
+
+    Args:
+        name (str): Check name, used for display and unregistering.
+        needs (tuple): ColumnContext intermediates the check reads; prepared once per column.
+        applies (callable): Optional predicate on the column's contract rules; the check is skipped when False.
+        severities (tuple): Severities the check can fail with; gate mode skips it when none of them block.
+        cost (int): Relative cost; gate mode evaluates cheaper checks first.
+        gate (callable): Optional block evaluator gate(ctx, start, end) for gate mode, returning
+            (row, severity) for the first failing row in [start, end), or None. Checks without one
+            are run in full once by the gate, so every registered check can block it.
+
+    The check function receives a ColumnContext and returns a result dict, a list of them, or None.
+    """
+    def decorator(fn):
+        CHECK_REGISTRY.append({
+            "name": name, "fn": fn, "needs": tuple(needs), "applies": applies,
+            "severities": tuple(severities), "cost": cost, "gate": gate
+        })
+        return fn
+    return decorator
+
+
+def unregister_check(name: str) -> None:
+    CHECK_REGISTRY[:] = [c for c in CHECK_REGISTRY if c["name"] != name]
+
+
+# ---------------------- Gate Evaluators ----------------------
+
+def _first_true(mask: pd.Series, offset: int):
+    hits = np.flatnonzero(mask.to_numpy(dtype=bool, na_value=False))
+    return offset + int(hits[0]) if hits.size else None
+
+
+def _gate_hit(mask: pd.Series, offset: int, severity: str):
+    row = _first_true(mask, offset)
+    return None if row is None else (row, severity)
+
+
+def _gate_not_null(ctx, start, end):
+    return _gate_hit(ctx.series.iloc[start:end].isnull(), start, "high")
+
+
+def _gate_unique(ctx, start, end):
+    # Nulls count against uniqueness, as in the full check (nunique / total rows)
+    first_null = _first_true(ctx.series.iloc[start:end].isnull(), start)
+    # Prefix check over geometrically growing blocks keeps total work O(n)
+    prefix = ctx.series.iloc[:end]
+    positions = np.flatnonzero(prefix.notna().to_numpy())
+    dup = find_duplicate_rows(prefix.iloc[positions].to_frame()).to_numpy()
+    hits = np.flatnonzero(dup)
+    first_dup = int(positions[hits[0]]) if hits.size else None
+    found = [r for r in (first_null, first_dup) if r is not None]
+    return (min(found), "high") if found else None
+
+
+def _gate_regex(ctx, start, end):
+    pattern = ctx.contract["regex"]
+    try:
+        re.compile(pattern)
+    except re.error:
+        return (0, "high")
+    block = ctx.series.iloc[start:end]
+    matched = block.astype(str).str.fullmatch(pattern).to_numpy(dtype=bool, na_value=False)
+    return _gate_hit(pd.Series(~matched & block.notna().to_numpy()), start, "medium")
+
+
+def _gate_min(ctx, start, end):
+    if not ctx.is_numeric:
+        return None
+    return _gate_hit(ctx.series.iloc[start:end] < ctx.contract["min"], start, "medium")
+
+
+def _gate_max(ctx, start, end):
+    if not ctx.is_numeric:
+        return None
+    return _gate_hit(ctx.series.iloc[start:end] > ctx.contract["max"], start, "medium")
+
+
+def _gate_allowed_values(ctx, start, end):
+    block = ctx.series.iloc[start:end]
+    allowed = [str(v) for v in ctx.contract["allowed_values"]]
+    return _gate_hit(block.notna() & ~block.astype(str).isin(allowed), start, "medium")
+
+
+def _gate_string_length(ctx, start, end):
+    block = ctx.series.iloc[start:end]
+    lengths = block.astype(str).str.len()
+    min_len, max_len = ctx.contract.get("min_length"), ctx.contract.get("max_length")
+    bad = pd.Series(False, index=block.index)
+    if min_len is not None:
+        bad |= lengths < min_len
+    if max_len is not None:
+        bad |= lengths > max_len
+    return _gate_hit(bad & block.notna(), start, "medium")
+
+
+# ---------------------- Built-in Checks ----------------------
+
+@register_check("Null Check", needs=("null_ratio",), severities=("low", "medium"), cost=0)
+def _null_check(ctx):
+    null_ratio = ctx.null_ratio
+    return ctx.result(
+        "Null Check",
+        "FAIL" if null_ratio > 0 else "PASS",
+        f"{null_ratio:.2%} of values are null" if null_ratio > 0 else "No nulls found",
+        "medium" if null_ratio > 0.05 else "low",
+        failed_count=int(ctx.null_mask.sum()),
+        total_count=ctx.total_len,
+        ratio=float(null_ratio)
+    )
+
+
+@register_check("Uniqueness Check", needs=("unique_ratio",), severities=("low", "medium"), cost=2)
+def _uniqueness_check(ctx):
+    unique_ratio = ctx.unique_ratio
+    return ctx.result(
+        "Uniqueness Check",
+        "PASS" if unique_ratio >= 0.99 else "FAIL",
+        f"{unique_ratio:.2%} unique values",
+        "low" if unique_ratio >= 0.95 else "medium",
+        total_count=ctx.total_len,
+        ratio=float(unique_ratio),
+        value=ctx.nunique
+    )
+
+
+@register_check(
+    "Contract - Not Null", needs=("null_ratio",), applies=lambda c: c.get("not_null"),
+    severities=("high",), cost=0, gate=_gate_not_null
+)
+def _contract_not_null(ctx):
+    if ctx.null_ratio > 0:
+        return ctx.result(
+            "Contract - Not Null", "FAIL", f"Contract failed: {ctx.null_ratio:.2%} nulls found", "high",
+            failed_count=int(ctx.null_mask.sum()), total_count=ctx.total_len, ratio=float(ctx.null_ratio)
+        )
+
+
+@register_check(
+    "Contract - Unique", needs=("unique_ratio",), applies=lambda c: c.get("unique"),
+    severities=("high",), cost=2, gate=_gate_unique
+)
+def _contract_unique(ctx):
+    if ctx.unique_ratio < 1.0:
+        return ctx.result(
+            "Contract - Unique", "FAIL", f"Contract failed: Only {ctx.unique_ratio:.2%} unique values", "high",
+            total_count=ctx.total_len, ratio=float(ctx.unique_ratio), value=ctx.nunique
+        )
+
+
+@register_check(
+    "Contract - Regex", needs=("str_values",), applies=lambda c: c.get("regex"),
+    severities=("medium", "high"), cost=3, gate=_gate_regex
+)
+def _contract_regex(ctx):
+    regex = ctx.contract["regex"]
+    try:
+        re.compile(regex)
+    except re.error as e:
+        return ctx.result("Contract - Regex", "FAIL", f"Invalid regex pattern: {e}", "high")
+
+    # Matched once per distinct value, weighted by its count
+    matched = ctx.str_values.str.fullmatch(regex).to_numpy(dtype=bool, na_value=False)
+    mismatch_ratio = ctx.ratio_of(~matched)
+    metrics = {"failed_count": ctx.count_of(~matched), "total_count": len(ctx.non_null), "ratio": float(mismatch_ratio)}
+    if mismatch_ratio > 0:
+        return ctx.result("Contract - Regex", "FAIL", f"{mismatch_ratio:.2%} values do not match pattern `{regex}`", "medium", **metrics)
+    return ctx.result("Contract - Regex", "PASS", "All values match the expected pattern", "low", **metrics)
+
+
+@register_check(
+    "Contract - Min Value", applies=lambda c: c.get("min") is not None,
+    severities=("medium",), cost=1, gate=_gate_min
+)
+def _contract_min(ctx):
+    if not ctx.is_numeric:
+        return None
+    val_min = ctx.contract["min"]
+    below_min = (ctx.series < val_min).sum()
+    metrics = {"failed_count": int(below_min), "total_count": ctx.total_len, "lower_bound": val_min}
+    if below_min > 0:
+        return ctx.result("Contract - Min Value", "FAIL", f"{below_min} values below minimum ({val_min})", "medium", **metrics)
+    return ctx.result("Contract - Min Value", "PASS", f"All values above minimum ({val_min})", "low", **metrics)
+
+
+@register_check(
+    "Contract - Max Value", applies=lambda c: c.get("max") is not None,
+    severities=("medium",), cost=1, gate=_gate_max
+)
+def _contract_max(ctx):
+    if not ctx.is_numeric:
+        return None
+    val_max = ctx.contract["max"]
+    above_max = (ctx.series > val_max).sum()
+    metrics = {"failed_count": int(above_max), "total_count": ctx.total_len, "upper_bound": val_max}
+    if above_max > 0:
+        return ctx.result("Contract - Max Value", "FAIL", f"{above_max} values above maximum ({val_max})", "medium", **metrics)
+    return ctx.result("Contract - Max Value", "PASS", f"All values below maximum ({val_max})", "low", **metrics)
+
+
+@register_check(
+    "Contract - Allowed Values", needs=("str_values",), applies=lambda c: c.get("allowed_values"),
+    severities=("medium",), cost=3, gate=_gate_allowed_values
+)
+def _contract_allowed_values(ctx):
+    allowed = [str(v) for v in ctx.contract["allowed_values"]]
+    invalid = ~ctx.str_values.isin(allowed).to_numpy()
+    invalid_ratio = ctx.ratio_of(invalid)
+    metrics = {"failed_count": ctx.count_of(invalid), "total_count": len(ctx.non_null), "ratio": float(invalid_ratio)}
+    if invalid_ratio > 0:
+        examples = ctx.str_values[invalid].head(5).tolist()
+        return ctx.result(
+            "Contract - Allowed Values", "FAIL", f"{invalid_ratio:.2%} values outside the allowed set (e.g. {examples})", "medium", **metrics
+        )
+    return ctx.result("Contract - Allowed Values", "PASS", "All values are in the allowed set", "low", **metrics)
+
+
+@register_check(
+    "Contract - String Length",
+    needs=("str_values",),
+    applies=lambda c: c.get("min_length") is not None or c.get("max_length") is not None,
+    severities=("medium",),
+    cost=3,
+    gate=_gate_string_length
+)
+def _contract_string_length(ctx):
+    lengths = ctx.str_values.str.len().to_numpy()
+    min_len, max_len = ctx.contract.get("min_length"), ctx.contract.get("max_length")
+    bad = np.zeros(len(lengths), dtype=bool)
+    if min_len is not None:
+        bad |= lengths < min_len
+    if max_len is not None:
+        bad |= lengths > max_len
+    bad_ratio = ctx.ratio_of(bad)
+    bounds = f"[{min_len if min_len is not None else 0}, {max_len if max_len is not None else '∞'}]"
+    metrics = {
+        "failed_count": ctx.count_of(bad), "total_count": len(ctx.non_null), "ratio": float(bad_ratio),
+        "lower_bound": min_len, "upper_bound": max_len
+    }
+    if bad_ratio > 0:
+        return ctx.result("Contract - String Length", "FAIL", f"{bad_ratio:.2%} values have length outside {bounds}", "medium", **metrics)
+    return ctx.result("Contract - String Length", "PASS", f"All value lengths within {bounds}", "low", **metrics)
+
+
+@register_check(
+    "Contract - Freshness", needs=("non_null",), applies=lambda c: c.get("max_age_days") is not None,
+    severities=("high",), cost=4
+)
+def _contract_freshness(ctx):
+    max_age = ctx.contract["max_age_days"]
+    latest = pd.to_datetime(ctx.non_null, errors="coerce", utc=True).max()
+    if pd.isna(latest):
+        return ctx.result("Contract - Freshness", "FAIL", "No parseable dates found", "high")
+    age_days = (pd.Timestamp.now(tz="UTC") - latest).total_seconds() / 86400
+    metrics = {"value": age_days, "upper_bound": max_age}
+    if age_days > max_age:
+        return ctx.result("Contract - Freshness", "FAIL", f"Latest value is {age_days:.1f} days old (max {max_age})", "high", **metrics)
+    return ctx.result("Contract - Freshness", "PASS", f"Latest value is {age_days:.1f} days old", "low", **metrics)
+
+
+@register_check("Contract - References", applies=lambda c: c.get("references"), severities=("high",), cost=5)
+def _contract_references(ctx):
+    return check_references(ctx.series, ctx.contract["references"], ctx.reference_data)
+
+
+# ---------------------- Executor ----------------------
+
+def run_basic_checks(df: pd.DataFrame, contract_rules: dict = None, reference_data: dict = None, progress=None):
+    """
+    Runs every registered check on every column. Checks on one column share a single
+    ColumnContext, so null masks, non-null views and value counts are computed once.
+    """
     results = []
 
     if df.empty:
         return results
 
-    for col in df.columns:
-        series = df[col]
-        col_results = []
-        col_contract = contract_rules.get(col, {}) if contract_rules else {}
+    total_cols = len(df.columns)
+    for i, col in enumerate(df.columns):
+        if progress:
+            progress(i, total_cols, f"Checking {col}")
 
-        non_null_series = series.dropna()
-        total_len = len(series)
-
-        # --- Basic Null Check ---
-        null_ratio = series.isnull().mean()
-        col_results.append({
-            "column": col,
-            "check": "Null Check",
-            "status": "FAIL" if null_ratio > 0 else "PASS",
-            "message": f"{null_ratio:.2%} of values are null" if null_ratio > 0 else "No nulls found",
-            "severity": "medium" if null_ratio > 0.05 else "low"
-        })
+        col_contract = contract_rules.get(col, {}) if contract_rules else {}
+        ctx = ColumnContext(col, df[col], col_contract, reference_data)
 
-        # --- Basic Uniqueness Check ---
-        unique_ratio = non_null_series.nunique() / total_len if total_len else 0
-        col_results.append({
-            "column": col,
-            "check": "Uniqueness Check",
-            "status": "PASS" if unique_ratio >= 0.99 else "FAIL",
-            "message": f"{unique_ratio:.2%} unique values",
-            "severity": "low" if unique_ratio >= 0.95 else "medium"
-        })
+        active = [c for c in CHECK_REGISTRY if c["applies"] is None or c["applies"](col_contract)]
+        for need in dict.fromkeys(n for c in active for n in c["needs"]):
+            getattr(ctx, need)
 
-        # --- Contract: Not Null ---
-        if col_contract.get("not_null") and null_ratio > 0:
-            col_results.append({
-                "column": col,
-                "check": "Contract - Not Null",
-                "status": "FAIL",
-                "message": f"Contract failed: {null_ratio:.2%} nulls found",
-                "severity": "high"
-            })
-
-        # --- Contract: Unique ---
-        if col_contract.get("unique") and unique_ratio < 1.0:
-            col_results.append({
-                "column": col,
-                "check": "Contract - Unique",
-                "status": "FAIL",
-                "message": f"Contract failed: Only {unique_ratio:.2%} unique values",
-                "severity": "high"
-            })
-
-        # --- Contract: Regex Pattern ---
-        regex = col_contract.get("regex")
-        if regex:
-            try:
-                mismatch_ratio = non_null_series.apply(lambda x: not re.fullmatch(regex, str(x))).mean()
-                if mismatch_ratio > 0:
-                    col_results.append({
-                        "column": col,
-                        "check": "Contract - Regex",
-                        "status": "FAIL",
-                        "message": f"{mismatch_ratio:.2%} values do not match pattern `{regex}`",
-                        "severity": "medium"
-                    })
-                else:
-                    col_results.append({
-                        "column": col,
-                        "check": "Contract - Regex",
-                        "status": "PASS",
-                        "message": "All values match the expected pattern",
-                        "severity": "low"
-                    })
-            except re.error as e:
-                col_results.append({
-                    "column": col,
-                    "check": "Contract - Regex",
-                    "status": "FAIL",
-                    "message": f"Invalid regex pattern: {e}",
-                    "severity": "high"
-                })
-
-        # --- Contract: Numeric Bounds ---
-        if series.dtype.kind in "iufc":
-            val_min = col_contract.get("min")
-            val_max = col_contract.get("max")
-
-            if val_min is not None:
-                below_min = (series < val_min).sum()
-                if below_min > 0:
-                    col_results.append({
-                        "column": col,
-                        "check": "Contract - Min Value",
-                        "status": "FAIL",
-                        "message": f"{below_min} values below minimum ({val_min})",
-                        "severity": "medium"
-                    })
-                else:
-                    col_results.append({
-                        "column": col,
-                        "check": "Contract - Min Value",
-                        "status": "PASS",
-                        "message": f"All values above minimum ({val_min})",
-                        "severity": "low"
-                    })
-
-            if val_max is not None:
-                above_max = (series > val_max).sum()
-                if above_max > 0:
-                    col_results.append({
-                        "column": col,
-                        "check": "Contract - Max Value",
-                        "status": "FAIL",
-                        "message": f"{above_max} values above maximum ({val_max})",
-                        "severity": "medium"
-                    })
-                else:
-                    col_results.append({
-                        "column": col,
-                        "check": "Contract - Max Value",
-                        "status": "PASS",
-                        "message": f"All values below maximum ({val_max})",
-                        "severity": "low"
-                    })
-
-        results.extend(col_results)
+        for check in active:
+            started = time.perf_counter()
+            outcome = check["fn"](ctx)
+            if outcome is None:
+                continue
+            outcome = outcome if isinstance(outcome, list) else [outcome]
+            duration_ms = (time.perf_counter() - started) * 1000
+            for r in outcome:
+                r.setdefault("duration_ms", duration_ms)
+            results.extend(outcome)
 
     return results
+
+
+# ---------------------- Gate Mode ----------------------
+
+def _full_check_gate(check: dict, severities: tuple):
+    """
+    Gate evaluator for a registered check without a block evaluator: runs the full
+    check once, on the first block, and blocks on any failure at a blocking severity.
+    """
+    def evaluate(ctx, start, end):
+        if start:
+            return None
+        outcome = check["fn"](ctx) or []
+        for r in outcome if isinstance(outcome, list) else [outcome]:
+            if r["status"] == "FAIL" and r["severity"] in severities:
+                return (None, r["severity"])
+        return None
+    return evaluate
+
+
+def _gate_tasks(df: pd.DataFrame, contract_rules: dict, reference_data: dict, severities: tuple) -> list:
+    """
+    Builds (cost, column, check, ctx, evaluate) tasks from CHECK_REGISTRY, so the gate runs
+    the same rule set as run_basic_checks. Checks that cannot fail at a blocking severity
+    are left out.
+    """
+    tasks = []
+    for col in df.columns:
+        col_contract = (contract_rules or {}).get(col, {})
+        if not isinstance(col_contract, dict):
+            continue
+        ctx = ColumnContext(col, df[col], col_contract, reference_data)
+        for check in CHECK_REGISTRY:
+            if check["applies"] is not None and not check["applies"](col_contract):
+                continue
+            if not set(check["severities"]) & set(severities):
+                continue
+            evaluate = check["gate"] or _full_check_gate(check, severities)
+            tasks.append((check["cost"], col, check["name"], ctx, evaluate))
+
+    tasks.sort(key=lambda t: t[0])
+    return tasks
+
+
+def _gate_first_repeat(df: pd.DataFrame, columns: list, severity: str):
+    """
+    Block evaluator for key uniqueness: hashes the prefix up to the block end, so a
+    repeat is found as soon as its block is reached (total work stays O(n) as blocks double).
+    """
+    def evaluate(ctx, start, end):
+        dup = find_duplicate_rows(df.iloc[:end], columns).to_numpy()
+        hits = np.flatnonzero(dup)
+        return (int(hits[0]), severity) if hits.size else None
+    return evaluate
+
+
+def _dataset_gate_tasks(df: pd.DataFrame, dataset_rules: dict, severities: tuple) -> list:
+    """
+    Builds gate tasks for the row-level dataset rules of run_dataset_checks
+    (unique_key, no_duplicate_rows, column_comparisons), in the _gate_tasks format.
+    """
+    tasks = []
+    for key_columns in normalize_key_sets(dataset_rules.get("unique_key")):
+        if "high" not in severities:
+            break
+        check_name = f"Dataset: Unique Key ({', '.join(map(str, key_columns))})"
+        if any(c not in df.columns for c in key_columns):
+            # Missing key columns fail the rule outright, as in check_unique_key
+            tasks.append((0, "_dataset", check_name, None, lambda ctx, start, end: None if start else (None, "high")))
+            continue
+        tasks.append((2, "_dataset", check_name, None, _gate_first_repeat(df, key_columns, "high")))
+
+    if dataset_rules.get("no_duplicate_rows") is True and "medium" in severities:
+        tasks.append((3, "_dataset", "Dataset: No Duplicate Rows", None, _gate_first_repeat(df, None, "medium")))
+
+    for rule in dataset_rules.get("column_comparisons", []) or []:
+        def evaluate(ctx, start, end, rule=rule):
+            # Invalid or incomparable rules fail high; violations fail medium
+            result = check_column_comparison(df.iloc[start:end], rule)
+            return (None, result["severity"]) if result["status"] == "FAIL" else None
+        tasks.append((1, "_dataset", f"Dataset: Comparison ({rule})", None, evaluate))
+
+    return tasks
+
+
+def run_gate_checks(
+    df: pd.DataFrame,
+    contract_rules: dict = None,
+    dataset_rules: dict = None,
+    reference_data: dict = None,
+    severities: tuple = ("high",),
+    block_size: int = GATE_BLOCK_SIZE
+) -> dict:
+    """
+    Fail-fast gate: answers whether any blocking contract rule fails, stopping at the first
+    confirmed failure instead of evaluating and reporting every check.
+
+    Checks are ordered by cost and evaluated over row blocks that double in size, so a
+    failure near the start of the data is found after scanning only a few rows.
+
+    Args:
+        df (pd.DataFrame): Input data.
+        contract_rules (dict): Column-level contract rules.
+        dataset_rules (dict): Dataset-level rules, gated like run_dataset_checks.
+        reference_data (dict): Parent tables for `references` rules.
+        severities (tuple): Severities that block the gate.
+        block_size (int): Rows in the first block.
+
+    Returns:
+        dict: passed, plus check, column, severity and row for the triggering failure,
+              rows_scanned and elapsed seconds.
+    """
+    started = time.perf_counter()
+
+    def verdict(passed, check=None, column=None, severity=None, row=None, rows_scanned=0):
+        return {
+            "passed": passed,
+            "check": check,
+            "column": column,
+            "severity": severity,
+            "row": row,
+            "rows_scanned": rows_scanned,
+            "elapsed": round(time.perf_counter() - started, 6)
+        }
+
+    # --- Metadata-level rules first: no row scan needed ---
+    dataset_rules = dataset_rules or {}
+    dataset_results = []
+    if "row_count_min" in dataset_rules:
+        dataset_results.append(check_row_count_min(len(df), dataset_rules["row_count_min"]))
+    if dataset_rules.get("schema_match") is True:
+        dataset_results.append(check_schema_match(dict(df.dtypes.items()), contract_rules))
+    for r in dataset_results:
+        if r["status"] == "FAIL" and r["severity"] in severities:
+            return verdict(False, r["check"], "_dataset", r["severity"])
+
+    tasks = _gate_tasks(df, contract_rules, reference_data, severities)
+    tasks += _dataset_gate_tasks(df, dataset_rules, severities)
+    tasks.sort(key=lambda t: t[0])
+    start, size = 0, block_size
+    while start < len(df) and tasks:
+        end = min(len(df), start + size)
+        for _, col, check, ctx, evaluate in tasks:
+            hit = evaluate(ctx, start, end)
+            if hit is not None and hit[1] in severities:
+                return verdict(False, check, col, hit[1], hit[0], end)
+        start, size = end, size * 2
+
+    return verdict(True, rows_scanned=len(df))
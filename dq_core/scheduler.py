@@ -0,0 +1,299 @@
+# dq_core/scheduler.py
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, List
+import numpy as np
+import pandas as pd
+from dq_core.anomaly_engine import scan_for_anomalies
+from dq_core.contracts import load_contract
+from dq_core.dataset_rules import run_dataset_checks
+from dq_core.rule_engine import run_basic_checks
+
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_SOURCE_LIMIT = 2
+DEFAULT_MEMORY_BUDGET = 2 * 1024 ** 3
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 1.0
+DEFAULT_WAREHOUSE_ESTIMATE = 256 * 1024 ** 2
+FILE_MEMORY_FACTOR = {"csv": 3.0, "parquet": 5.0}
+
+
+class PermanentError(Exception):
+    """Raised for task failures that retrying cannot fix (e.g. a misconfigured entry)."""
+
+
+# ---------------------- Connectors ----------------------
+
+def load_file_source(source: dict) -> pd.DataFrame:
+    """
+    Loads a {"type": "file", "path": ...} source (CSV or Parquet).
+    """
+    path = source["path"]
+    if path.lower().endswith((".parquet", ".pq")):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, low_memory=False)
+
+
+def load_snowflake_source(source: dict) -> pd.DataFrame:
+    """
+    Loads a {"type": "snowflake", "table": ..., "schema": ..., "connection": {...}} source.
+    """
+    import snowflake.connector
+    conn = snowflake.connector.connect(**source["connection"])
+    try:
+        query = source.get("query") or f"SELECT * FROM {source['schema']}.{source['table']}"
+        return pd.read_sql(query, conn)
+    finally:
+        conn.close()
+
+
+DEFAULT_CONNECTORS = {
+    "file": load_file_source,
+    "snowflake": load_snowflake_source,
+}
+
+
+def estimate_memory(entry: dict) -> int:
+    """
+    Estimates the in-memory size of a catalogue entry's data. An explicit
+    "memory_estimate" wins; files are sized from disk with a per-format factor.
+    """
+    if entry.get("memory_estimate"):
+        return int(entry["memory_estimate"])
+    source = entry.get("source") or {}
+    if source.get("type") == "file" and os.path.exists(source["path"]):
+        fmt = "parquet" if source["path"].lower().endswith((".parquet", ".pq")) else "csv"
+        return int(os.path.getsize(source["path"]) * FILE_MEMORY_FACTOR[fmt])
+    return DEFAULT_WAREHOUSE_ESTIMATE
+
+
+# ---------------------- Pipeline ----------------------
+
+def validate_entry(entry: dict, connectors: Dict[str, Callable]) -> dict:
+    """
+    Runs ingestion, column and dataset checks, and the anomaly scan for one catalogue entry.
+    """
+    source = entry["source"]
+    connector = connectors.get(source.get("type"))
+    if connector is None:
+        raise PermanentError(f"No connector for source type `{source.get('type')}`")
+
+    contract = entry.get("contract") or {}
+    if isinstance(contract, str):
+        if not os.path.exists(contract):
+            raise PermanentError(f"Contract file `{contract}` not found")
+        contract = load_contract(contract)
+
+    df = connector(source)
+    column_rules = contract.get("column_checks", {})
+    results = run_basic_checks(df, column_rules)
+    results.extend(run_dataset_checks(df, contract.get("dataset_checks", {}), column_rules))
+    anomalies = scan_for_anomalies(df)
+
+    return {
+        "rows": len(df),
+        "results": results,
+        "anomalies": anomalies,
+        "failed_checks": sum(1 for r in results if r["status"] == "FAIL")
+    }
+
+
+# ---------------------- Scheduler ----------------------
+
+class _Task:
+    def __init__(self, entry: dict, seq: int):
+        source = entry.get("source") if isinstance(entry.get("source"), dict) else {}
+        self.entry = entry
+        self.name = entry.get("name") or source.get("table") or source.get("path") or f"entry {seq}"
+        self.priority = int(entry.get("priority", 0))
+        self.source_type = source.get("type")
+        self.memory = estimate_memory(entry)
+        self.seq = seq
+        self.attempts = 0
+        self.not_before = 0.0
+        self.queued_at = time.time()
+        self.started_at = None
+        self.errors = []
+
+
+class ValidationScheduler:
+    """
+    Runs the validation pipeline over a catalogue of (source, contract) entries on a
+    bounded worker pool.
+
+    Catalogue entries look like:
+        {"name": "orders", "priority": 10,
+         "source": {"type": "file", "path": "orders.parquet"},
+         "contract": "contracts/orders.json"}   # path or contract dict
+
+    Higher priorities run first. A task only starts when its source type is below
+    its concurrency limit and its memory estimate fits the remaining budget (a task
+    larger than the whole budget still runs, alone). Failed tasks are retried with
+    exponential backoff, except for PermanentError failures. After cancel(), queued
+    tasks are reported as cancelled and tasks already running are reported with
+    their outcome.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        source_limits: Dict[str, int] = None,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        connectors: Dict[str, Callable] = None
+    ):
+        self.max_workers = max_workers
+        self.source_limits = source_limits or {}
+        self.memory_budget = memory_budget
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.connectors = {**DEFAULT_CONNECTORS, **(connectors or {})}
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def _can_start(self, task: _Task, running: Dict, memory_in_use: int) -> bool:
+        limit = self.source_limits.get(task.source_type, DEFAULT_SOURCE_LIMIT)
+        same_source = sum(1 for t in running.values() if t.source_type == task.source_type)
+        if same_source >= limit:
+            return False
+        return not running or memory_in_use + task.memory <= self.memory_budget
+
+    def run(self, catalogue: List[dict], progress=None) -> dict:
+        """
+        Validates every catalogue entry and returns {"reports": [...], "metrics": {...}}.
+
+        Args:
+            catalogue (list): Catalogue entries.
+            progress (callable): Optional callback progress(done, total, message).
+        """
+        counter = itertools.count()
+        queue, reports = [], []
+        for entry in catalogue:
+            task = _Task(entry, next(counter))
+            if not isinstance(entry.get("source"), dict):
+                # Malformed entries fail on their own instead of aborting the batch
+                task.errors.append("Catalogue entry has no `source`")
+                reports.append(self._report(task, None, time.time()))
+                continue
+            heapq.heappush(queue, (-task.priority, task.seq, task))
+
+        total = len(catalogue)
+        running = {}
+        memory_in_use, retries = 0, 0
+        started = time.time()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dq-sched") as pool:
+            while (queue or running) and not self._cancel.is_set():
+                # --- Dispatch: highest priority first, skipping tasks blocked by limits ---
+                now = time.time()
+                deferred = []
+                while queue and len(running) < self.max_workers:
+                    item = heapq.heappop(queue)
+                    task = item[2]
+                    if task.not_before > now or not self._can_start(task, running, memory_in_use):
+                        deferred.append(item)
+                        continue
+                    task.attempts += 1
+                    task.started_at = time.time()
+                    memory_in_use += task.memory
+                    running[pool.submit(validate_entry, task.entry, self.connectors)] = task
+                for item in deferred:
+                    heapq.heappush(queue, item)
+
+                if not running:
+                    # Only backoff-delayed tasks remain
+                    wake = min(item[2].not_before for item in queue)
+                    time.sleep(max(0.0, min(wake - time.time(), 1.0)))
+                    continue
+
+                done, _ = wait(list(running), timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    memory_in_use -= task.memory
+                    finished_at = time.time()
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        task.errors.append(f"{e}")
+                        if task.attempts <= self.max_retries and not isinstance(e, PermanentError):
+                            retries += 1
+                            task.not_before = finished_at + self.retry_backoff * 2 ** (task.attempts - 1)
+                            heapq.heappush(queue, (-task.priority, task.seq, task))
+                            continue
+                        outcome = None
+
+                    reports.append(self._report(task, outcome, finished_at))
+                    if progress:
+                        progress(len(reports), total, f"Validated {task.name}")
+
+            # --- Cancelled: let in-flight tasks finish and report them, without retries ---
+            for future, task in running.items():
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    task.errors.append(f"{e}")
+                    outcome = None
+                reports.append(self._report(task, outcome, time.time()))
+
+        cancelled = [item[2] for item in queue]
+        for task in cancelled:
+            reports.append(self._report(task, None, time.time(), status="cancelled"))
+
+        return {"reports": reports, "metrics": self._metrics(reports, retries, time.time() - started)}
+
+    @staticmethod
+    def _report(task: _Task, outcome, finished_at: float, status: str = None) -> dict:
+        if status is None:
+            status = "done" if outcome is not None else "failed"
+        report = {
+            "name": task.name,
+            "source_type": task.source_type,
+            "priority": task.priority,
+            "status": status,
+            "attempts": task.attempts,
+            "queue_latency": round(task.started_at - task.queued_at, 4) if task.started_at else None,
+            "duration": round(finished_at - task.started_at, 4) if task.started_at else None,
+            "rows": None,
+            "failed_checks": None,
+            "anomaly_count": None,
+            "errors": task.errors,
+            "results": [],
+            "anomalies": []
+        }
+        if outcome is not None:
+            report.update({
+                "rows": outcome["rows"],
+                "failed_checks": outcome["failed_checks"],
+                "anomaly_count": len(outcome["anomalies"]),
+                "results": outcome["results"],
+                "anomalies": outcome["anomalies"]
+            })
+        return report
+
+    @staticmethod
+    def _metrics(reports: list, retries: int, elapsed: float) -> dict:
+        done = [r for r in reports if r["status"] == "done"]
+        latencies = np.array([r["queue_latency"] for r in reports if r["queue_latency"] is not None])
+        rows = sum(r["rows"] for r in done)
+        return {
+            "tasks": len(reports),
+            "succeeded": len(done),
+            "failed": sum(1 for r in reports if r["status"] == "failed"),
+            "cancelled": sum(1 for r in reports if r["status"] == "cancelled"),
+            "retries": retries,
+            "elapsed": round(elapsed, 4),
+            "tasks_per_second": round(len(done) / elapsed, 4) if elapsed else None,
+            "rows_per_second": round(rows / elapsed, 2) if elapsed else None,
+            "queue_latency_mean": round(float(latencies.mean()), 4) if latencies.size else None,
+            "queue_latency_p95": round(float(np.percentile(latencies, 95)), 4) if latencies.size else None,
+            "queue_latency_max": round(float(latencies.max()), 4) if latencies.size else None
+        }
@@ -24,3 +24,43 @@ def extract_failed_columns(results: list) -> list:
     Extracts column names from failed check results.
     """
     return list({r["column"] for r in results if r.get("status") == "FAIL" and r.get("column")})
+
+
+RESULT_COLUMNS = ["column", "check", "status", "severity", "message"]
+
+
+def results_to_frame(results: list, columns: list = None) -> pd.DataFrame:
+    """
+    Converts a list of result dicts into a DataFrame with a fixed column order,
+    so that filtering and paging can be done with vectorized masks.
+    """
+    columns = columns or RESULT_COLUMNS
+    frame = pd.DataFrame.from_records(results or [])
+    for col in columns:
+        if col not in frame.columns:
+            frame[col] = None
+    return frame[columns + [c for c in frame.columns if c not in columns]]
+
+
+def filter_results(frame: pd.DataFrame, **filters) -> pd.DataFrame:
+    """
+    Filters a results DataFrame, e.g. filter_results(frame, status=["FAIL"], severity=["high"]).
+    Each keyword names a column and lists the accepted values (compared as strings).
+    Empty filters match everything.
+    """
+    mask = pd.Series(True, index=frame.index)
+    for name, values in filters.items():
+        if values:
+            mask &= frame[name].astype(str).isin([str(v) for v in values])
+    return frame[mask]
+
+
+def page_window(total: int, page: int, page_size: int = 50) -> tuple:
+    """
+    Returns (offset, page_count) for a page over `total` rows. Page numbers start
+    at 1 and are clamped to the valid range.
+    """
+    page_count = max(1, -(-total // page_size))
+    page = min(max(1, page), page_count)
+    return (page - 1) * page_size, page_count
+
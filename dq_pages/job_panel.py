@@ -0,0 +1,71 @@
+import streamlit as st
+import pandas as pd
+from dq_core.jobs import get_job_manager, DONE, FAILED
+
+
+REFRESH_SECONDS = 1.0
+
+
+def submit_job(kind: str, name: str, fn, *args, **kwargs):
+    """
+    Submits a background job and remembers its id in this session under `kind`.
+    """
+    job = get_job_manager().submit(name, fn, *args, **kwargs)
+    st.session_state.setdefault("jobs", {}).setdefault(kind, []).append(job.id)
+    return job
+
+
+def render_job_panel(kind: str, on_done):
+    """
+    Shows progress and cancel controls for this session's jobs of one kind, and
+    calls on_done(job) once for every job that finished successfully. Failures
+    stay visible until dismissed.
+
+    While jobs are running the panel refreshes itself (as a fragment where supported),
+    so widget interaction never blocks on or discards running work.
+    """
+    job_ids = st.session_state.get("jobs", {}).get(kind, [])
+    running = any(not job.finished for job in get_job_manager().jobs(job_ids))
+
+    if running and hasattr(st, "fragment"):
+        st.fragment(run_every=REFRESH_SECONDS)(_job_panel)(kind, on_done, True)
+    else:
+        _job_panel(kind, on_done, False)
+
+
+def _job_panel(kind: str, on_done, in_fragment: bool):
+    job_ids = st.session_state.get("jobs", {}).get(kind, [])
+    jobs = get_job_manager().jobs(job_ids)
+    if not jobs:
+        return
+
+    applied = st.session_state.setdefault("applied_jobs", set())
+    newly_finished = [job for job in jobs if job.finished and job.id not in applied]
+    for job in newly_finished:
+        if job.status == DONE:
+            on_done(job)
+        applied.add(job.id)
+    # Any finished job ends the fragment's polling; a full rerun redraws the page without it
+    if newly_finished and in_fragment:
+        st.rerun()
+
+    dismissed = st.session_state.setdefault("dismissed_jobs", set())
+    for job in jobs:
+        if job.finished:
+            if job.status == FAILED and job.id not in dismissed:
+                c1, c2 = st.columns([5, 1])
+                c1.error(f"❌ {job.name} failed: {job.error}")
+                if c2.button("Dismiss", key=f"dismiss_{job.id}"):
+                    dismissed.add(job.id)
+                    st.rerun()
+            continue
+        c1, c2 = st.columns([5, 1])
+        c1.progress(job.progress, text=f"{job.name}: {job.message or job.status}")
+        if c2.button("✖️ Cancel", key=f"cancel_{job.id}", disabled=job.cancel_requested):
+            job.cancel()
+
+    if any(not job.finished for job in jobs) and not in_fragment:
+        st.button("🔄 Refresh progress", key=f"refresh_{kind}")
+
+    with st.expander(f"🧵 Jobs ({len(jobs)})"):
+        st.dataframe(pd.DataFrame([job.to_dict() for job in reversed(jobs)]), use_container_width=True, hide_index=True)
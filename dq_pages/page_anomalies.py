@@ -1,5 +1,13 @@
 import streamlit as st
 from dq_core.anomaly_engine import scan_for_anomalies
+from dq_core.drift import build_baseline, detect_drift, save_baseline, load_baseline
+from dq_core.results import results_to_arrow, build_exports
+from dq_core.utils import results_to_frame
+from dq_pages.results_table import render_results_table, render_results_export
+from dq_pages.job_panel import submit_job, render_job_panel
+
+
+ANOMALY_COLUMNS = ["column", "severity", "issue", "outlier_count", "total_count", "mean", "std_dev", "bounds"]
 
 
 def render():
@@ -14,33 +22,86 @@ def render():
     st.markdown("Use this tool to detect unusual patterns, outliers, or statistical anomalies before business impact.")
 
     if st.button("🔍 Run Anomaly Scan"):
-        with st.spinner("Scanning for anomalies..."):
-            anomalies = scan_for_anomalies(df)
-            st.session_state["anomaly_results"] = anomalies  # Store results in session state
-
-        if anomalies:
-            st.error(f"❗ {len(anomalies)} potential anomalies detected:")
-            for item in anomalies:
-                st.markdown(
-                    f"""
-                    <div style="padding: 6px; border-left: 5px solid orange; margin-bottom: 6px;">
-                    <strong>{item['column']}</strong><br>
-                    {item['issue']}<br>
-                    Mean: {item['mean']}, Std Dev: {item['std_dev']}<br>
-                    Bounds: {item['bounds'][0]} to {item['bounds'][1]}<br>
-                    Severity: **{item['severity'].capitalize()}**
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
-        else:
-            st.session_state["anomaly_results"] = []
-            st.success("✅ No anomalies found.")
+        submit_job("anomalies", "Anomaly Scan", run_anomaly_scan, df, st.session_state.get("dataset_name", "session"))
+
+    render_job_panel("anomalies", apply_anomaly_job)
+
+    if "anomaly_results" not in st.session_state:
+        st.info("Click the button above to run a basic anomaly scan.")
+    elif not st.session_state["anomaly_results"]:
+        st.success("✅ No anomalies found.")
     else:
-        # Show last results if present
-        if "anomaly_results" in st.session_state and st.session_state["anomaly_results"]:
-            st.warning("⚠️ Previous anomaly scan results:")
-            for item in st.session_state["anomaly_results"]:
-                st.markdown(f"- **{item['column']}**: {item['issue']}")
+        anomalies = st.session_state["anomaly_results"]
+        anomaly_frame = st.session_state.get("anomaly_frame")
+        if anomaly_frame is None:
+            anomaly_frame = results_to_frame(anomalies, ANOMALY_COLUMNS)
+            st.session_state["anomaly_frame"] = anomaly_frame
+
+        st.error(f"❗ {len(anomalies)} potential anomalies detected:")
+        render_results_table(anomaly_frame, key="anomalies", filters=("severity", "column"))
+        if st.session_state.get("anomaly_table") is not None:
+            render_results_export(st.session_state["anomaly_table"], st.session_state["anomaly_exports"], key="anomalies")
+
+    render_drift()
+
+
+def run_anomaly_scan(df, dataset_name, progress=None) -> dict:
+    anomalies = scan_for_anomalies(df, progress=progress)
+    table = results_to_arrow(anomalies, dataset=dataset_name, source="anomalies")
+    return {
+        "results": anomalies,
+        "frame": results_to_frame(anomalies, ANOMALY_COLUMNS),
+        "table": table,
+        "exports": build_exports(table)
+    }
+
+
+def apply_anomaly_job(job):
+    # Store results in session state
+    st.session_state["anomaly_results"] = job.result["results"]
+    st.session_state["anomaly_frame"] = job.result["frame"]
+    st.session_state["anomaly_table"] = job.result["table"]
+    st.session_state["anomaly_exports"] = job.result["exports"]
+
+
+DRIFT_COLUMNS = ["column", "severity", "issue", "psi", "ks", "baseline_null_ratio", "null_ratio"]
+
+
+def render_drift():
+    df = st.session_state["raw_data"]
+    dataset_name = st.session_state.get("dataset_name", "session")
+
+    st.markdown("---")
+    st.subheader("📈 Drift vs Baseline")
+    st.markdown(
+        f"Compare the current data with the baseline sketch saved for `{dataset_name}` (stored next to the contract file)."
+    )
+
+    c1, c2 = st.columns(2)
+    if c1.button("💾 Save Current Data as Baseline"):
+        with st.spinner("Building baseline sketches..."):
+            save_baseline(build_baseline(df, dataset=dataset_name))
+        st.success(f"✅ Baseline saved for `{dataset_name}`.")
+
+    if c2.button("🔎 Check Drift"):
+        baseline = load_baseline(dataset=dataset_name)
+        if not baseline:
+            st.warning(f"⚠️ No baseline saved for `{dataset_name}` yet.")
         else:
-            st.info("Click the button above to run a basic anomaly scan.")
+            with st.spinner("Comparing with baseline..."):
+                drifts = detect_drift(df, baseline)
+            st.session_state["drift_results"] = drifts
+            st.session_state["drift_frame"] = results_to_frame(drifts, DRIFT_COLUMNS)
+            st.session_state["drift_table"] = results_to_arrow(drifts, dataset=dataset_name, source="drift")
+            st.session_state["drift_exports"] = build_exports(st.session_state["drift_table"])
+
+    if "drift_results" not in st.session_state:
+        return
+
+    if not st.session_state["drift_results"]:
+        st.success("✅ No drift detected.")
+        return
+
+    st.error(f"❗ {len(st.session_state['drift_results'])} column(s) drifted from the baseline:")
+    render_results_table(st.session_state["drift_frame"], key="drift", filters=("severity", "column"))
+    render_results_export(st.session_state["drift_table"], st.session_state["drift_exports"], key="drift")
@@ -1,11 +1,19 @@
 import streamlit as st
-from collections import defaultdict
-from dq_core.rule_engine import run_basic_checks
+from dq_core.rule_engine import run_basic_checks, run_gate_checks
+from dq_core.dataset_rules import run_dataset_checks
+from dq_core.incident_store import get_incident_store
+from dq_core.metadata import run_metadata_gate
+from dq_core.results import results_to_arrow, build_exports
+from dq_core.utils import results_to_frame, RESULT_COLUMNS
+from dq_pages.results_table import render_results_table, render_results_export
+from dq_pages.job_panel import submit_job, render_job_panel
 
 
 def render():
     st.header("✅ Run Checks")
 
+    render_metadata_gate()
+
     if "raw_data" not in st.session_state:
         st.warning("⚠️ Please ingest data first (via Ingestion tab).")
         return
@@ -18,127 +26,116 @@ def render():
     st.dataframe(df.head(10), use_container_width=True)
 
     if st.button("▶️ Run Validation"):
-        with st.spinner("Running validation checks..."):
-            check_results = run_basic_checks(df, contract_rules)
-
-            # --- Dataset-level Checks ---
-            if dataset_rules:
-                # Row Count Minimum
-                if "row_count_min" in dataset_rules:
-                    row_count = len(df)
-                    min_count = dataset_rules["row_count_min"]
-                    status = "PASS" if row_count >= min_count else "FAIL"
-                    msg = f"{row_count} rows found. Minimum expected: {min_count}."
-                    check_results.append({
-                        "check": "Dataset: Row Count Minimum",
-                        "status": status,
-                        "column": "_dataset",
-                        "message": msg
-                    })
-                    if status == "FAIL":
-                        st.session_state.setdefault("incident_log", []).append({
-                            "type": "Dataset Check",
-                            "column": "row_count",
-                            "message": msg
-                        })
-
-                # Schema Match
-                if dataset_rules.get("schema_match") is True:
-                    expected_cols = set(contract_rules.keys())
-                    actual_cols = set(df.columns)
-                    missing = expected_cols - actual_cols
-                    extra = actual_cols - expected_cols
-
-                    if not missing and not extra:
-                        check_results.append({
-                            "check": "Dataset: Schema Match",
-                            "status": "PASS",
-                            "column": "_dataset",
-                            "message": "Schema matches expected columns."
-                        })
-                    else:
-                        diff_msg = f"Missing: {list(missing)} | Extra: {list(extra)}"
-                        check_results.append({
-                            "check": "Dataset: Schema Match",
-                            "status": "FAIL",
-                            "column": "_dataset",
-                            "message": diff_msg
-                        })
-                        st.session_state.setdefault("incident_log", []).append({
-                            "type": "Schema Check",
-                            "column": "schema",
-                            "message": diff_msg
-                        })
-
-            # Save results in session for reuse
-            st.session_state["validation_results"] = check_results
-
-        # --- Summary ---
-        passed = sum(1 for r in check_results if r["status"] == "PASS")
-        failed = sum(1 for r in check_results if r["status"] == "FAIL")
-
-        st.metric("Total Checks", len(check_results))
-        st.metric("✅ Passed", passed)
-        st.metric("❌ Failed", failed)
-
-        # --- Grouped Display ---
-        grouped = defaultdict(list)
-        for r in check_results:
-            grouped[r.get("column", "unknown")].append(r)
+        submit_job(
+            "checks",
+            "Validation",
+            run_validation,
+            df,
+            contract_rules,
+            dataset_rules,
+            st.session_state.get("reference_data"),
+            st.session_state.get("dataset_name", "session")
+        )
+
+    if st.button("🚦 Run Gate (fail fast on high-severity rules)"):
+        verdict = run_gate_checks(df, contract_rules, dataset_rules, st.session_state.get("reference_data"))
+        if verdict["passed"]:
+            st.success(f"✅ Gate passed ({verdict['rows_scanned']} rows, {verdict['elapsed']:.3f}s).")
+        else:
+            row_note = f" at row {verdict['row']}" if verdict["row"] is not None else ""
+            st.error(
+                f"⛔ Gate failed: **{verdict['check']}** on `{verdict['column']}`{row_note} "
+                f"({verdict['rows_scanned']} rows scanned, {verdict['elapsed']:.3f}s)."
+            )
+
+    render_job_panel("checks", apply_validation_job)
+
+    # --- Results (current run or last run) ---
+    if "validation_results" in st.session_state:
+        results_frame = st.session_state.get("validation_frame")
+        if results_frame is None:
+            results_frame = results_to_frame(st.session_state["validation_results"])
+            st.session_state["validation_frame"] = results_frame
+
+        passed = int((results_frame["status"] == "PASS").sum())
+        failed = int((results_frame["status"] == "FAIL").sum())
+
+        m1, m2, m3 = st.columns(3)
+        m1.metric("Total Checks", len(results_frame))
+        m2.metric("✅ Passed", passed)
+        m3.metric("❌ Failed", failed)
 
         st.markdown("### 📌 Validation Results")
-        for col, checks in grouped.items():
-            col_name = col if col != "_dataset" else "🗂️ Dataset-Level Checks"
-            st.markdown(f"#### 📁 **{col_name}**")
-
-            for r in checks:
-                color = "#28a745" if r["status"] == "PASS" else "#dc3545"
-                st.markdown(
-                    f"""
-                    <div style="
-                        background-color: #1e1e1e;
-                        padding: 0.75em 1em;
-                        margin: 10px 0;
-                        border-left: 5px solid {color};
-                        border-radius: 6px;
-                    ">
-                        <div style="font-weight: bold;">🔍 {r['check']} — {r['status']}</div>
-                        <div style="color: #ccc;">{r['message']}</div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
+        render_results_table(results_frame, key="checks")
 
+        if st.session_state.get("validation_table") is not None:
+            render_results_export(st.session_state["validation_table"], st.session_state["validation_exports"], key="validation")
     else:
-        # Show past results if any
-        if "validation_results" in st.session_state:
-            st.info("⚙️ Showing last validation results.")
-            check_results = st.session_state["validation_results"]
-
-            grouped = defaultdict(list)
-            for r in check_results:
-                grouped[r.get("column", "unknown")].append(r)
-
-            st.markdown("### 📌 Validation Results")
-            for col, checks in grouped.items():
-                col_name = col if col != "_dataset" else "🗂️ Dataset-Level Checks"
-                st.markdown(f"#### 📁 **{col_name}**")
-                for r in checks:
-                    color = "#28a745" if r["status"] == "PASS" else "#dc3545"
-                    st.markdown(
-                        f"""
-                        <div style="
-                            background-color: #1e1e1e;
-                            padding: 0.75em 1em;
-                            margin: 10px 0;
-                            border-left: 5px solid {color};
-                            border-radius: 6px;
-                        ">
-                            <div style="font-weight: bold;">🔍 {r['check']} — {r['status']}</div>
-                            <div style="color: #ccc;">{r['message']}</div>
-                        </div>
-                        """,
-                        unsafe_allow_html=True
+        st.info("Click the button above to run validation.")
+
+
+def run_validation(df, contract_rules, dataset_rules, reference_data, dataset_name, progress=None) -> dict:
+    """
+    Runs column and dataset checks and records failing dataset checks as incidents.
+    Executed in a background job; must not touch st.session_state.
+    """
+    check_results = run_basic_checks(df, contract_rules, reference_data, progress=progress)
+
+    # --- Dataset-level Checks ---
+    if progress:
+        progress(len(df.columns), len(df.columns), "Dataset checks")
+    dataset_results = run_dataset_checks(df, dataset_rules, contract_rules)
+    check_results.extend(dataset_results)
+    incidents = [
+        {
+            "type": "Schema Check" if r["check"] == "Dataset: Schema Match" else "Dataset Check",
+            "column": "_dataset",
+            "check": r["check"],
+            "message": r["message"],
+            "severity": r["severity"]
+        }
+        for r in dataset_results if r["status"] == "FAIL"
+    ]
+    get_incident_store().record_many(incidents, dataset=dataset_name)
+
+    # The frame and export files are built once per run, not per rerun
+    table = results_to_arrow(check_results, dataset=dataset_name, source="checks")
+    return {
+        "results": check_results,
+        "frame": results_to_frame(check_results),
+        "table": table,
+        "exports": build_exports(table)
+    }
+
+
+def apply_validation_job(job):
+    st.session_state["validation_results"] = job.result["results"]
+    st.session_state["validation_frame"] = job.result["frame"]
+    st.session_state["validation_table"] = job.result["table"]
+    st.session_state["validation_exports"] = job.result["exports"]
+
+
+def render_metadata_gate():
+    with st.expander("⚡ Metadata-only Schema Gate"):
+        st.caption(
+            "Checks `row_count_min` and `schema_match` from file metadata only "
+            "(Parquet footers, Arrow IPC schemas, CSV header + newline count), without loading rows."
+        )
+        paths_text = st.text_area("File paths (one per line)", key="metadata_gate_paths")
+
+        if st.button("⚡ Run Metadata Gate"):
+            paths = [p.strip() for p in paths_text.splitlines() if p.strip()]
+            if not paths:
+                st.warning("Please enter at least one file path.")
+            else:
+                with st.spinner(f"Reading metadata for {len(paths)} file(s)..."):
+                    gate_results = run_metadata_gate(
+                        paths,
+                        st.session_state.get("dataset_rules", {}),
+                        st.session_state.get("contract_rules", {})
                     )
-        else:
-            st.info("Click the button above to run validation.")
+                rows = [dict(r, source=path) for path, results in gate_results.items() for r in results]
+                st.session_state["metadata_gate_frame"] = results_to_frame(rows, ["source"] + RESULT_COLUMNS)
+
+        if "metadata_gate_frame" in st.session_state:
+            render_results_table(st.session_state["metadata_gate_frame"], key="metadata_gate", filters=("status", "source"))
@@ -1,31 +1,53 @@
 import streamlit as st
 import pandas as pd
+from dq_core.incident_store import get_incident_store
+from dq_pages.results_table import render_page_size, render_pager
+
+
+INCIDENT_COLUMNS = ["last_seen", "dataset", "type", "column", "check", "message", "severity", "occurrences", "first_seen"]
 
 
 def render():
     st.header("🚨 Incident Tracker")
 
-    st.markdown("This section displays a running log of failed checks, anomalies, and schema issues identified during this session.")
+    st.markdown("This section displays the persistent log of failed checks, anomalies, and schema issues. Repeated incidents are merged and counted.")
 
-    # Ensure incident_log exists
-    if "incident_log" not in st.session_state:
-        st.session_state["incident_log"] = []
+    store = get_incident_store()
+    total = store.count()
 
-    incident_log = st.session_state["incident_log"]
-
-    if not incident_log:
-        st.success("✅ No incidents logged yet in this session.")
+    if not total:
+        st.success("✅ No incidents logged yet.")
         return
 
-    st.markdown(f"### 🔎 {len(incident_log)} Incident(s) Logged")
+    st.markdown(f"### 🔎 {total} Incident(s) Logged")
+
+    # --- Filters (applied in SQL) ---
+    f1, f2, f3, f4 = st.columns(4)
+    filters = {
+        "dataset": f1.multiselect("Dataset", store.distinct("dataset"), key="incidents_filter_dataset"),
+        "type": f2.multiselect("Type", store.distinct("type"), key="incidents_filter_type"),
+        "column": f3.multiselect("Column", store.distinct("column"), key="incidents_filter_column"),
+    }
+    page_size = render_page_size(f4, "incidents")
 
-    for i, entry in enumerate(reversed(incident_log), start=1):
-        st.error(
-            f"**#{i}:** `{entry.get('type', 'Unknown')}` in **{entry.get('column', 'N/A')}** → {entry.get('message', 'No details')}"
-        )
+    matching = store.count(**filters)
+    offset = render_pager(matching, page_size, "incidents")
+
+    rows = store.query(limit=page_size, offset=offset, **filters)
+    incident_frame = pd.DataFrame.from_records(rows, columns=INCIDENT_COLUMNS)
+    for col in ("first_seen", "last_seen"):
+        incident_frame[col] = pd.to_datetime(incident_frame[col], unit="s")
+
+    st.caption(f"Showing {len(incident_frame)} of {matching} incident(s) ({total} total).")
+    st.dataframe(incident_frame, use_container_width=True, hide_index=True)
 
     st.markdown("---")
 
-    if st.button("🧹 Clear Incident Log"):
-        st.session_state["incident_log"] = []
+    c1, c2 = st.columns(2)
+    if c1.button("🗜️ Apply Retention & Compact"):
+        removed = store.compact()
+        st.success(f"✅ Removed {removed} expired incident(s).")
+
+    if c2.button("🧹 Clear Incident Log"):
+        store.clear()
         st.success("✅ Incident log cleared.")
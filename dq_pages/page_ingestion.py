@@ -1,9 +1,41 @@
+import uuid
 import streamlit as st
 import pandas as pd
 import snowflake.connector
 from snowflake.connector.errors import ProgrammingError
+from dq_core.dataset_cache import get_dataset_cache, content_key, frame_key
+
+
+def _cache_holder() -> str:
+    if "cache_holder" not in st.session_state:
+        st.session_state["cache_holder"] = uuid.uuid4().hex
+    return st.session_state["cache_holder"]
+
+
+def use_cached_dataset(key: str, loader):
+    """
+    Loads a dataset through the shared cache and makes it this session's raw_data.
+    Sessions loading the same content share one memory-mapped copy.
+    """
+    cache = get_dataset_cache()
+    holder = _cache_holder()
+    df = cache.get_or_load(key, loader, holder=holder)
+
+    previous = st.session_state.get("dataset_key")
+    if previous != key:
+        if previous:
+            cache.release(previous, holder)
+        st.session_state["dataset_key"] = key
+
+    st.session_state["raw_data"] = df
+    return df
+
 
 def render():
+    # Renew this session's lease on every rerun; an abandoned session's lease expires
+    if st.session_state.get("dataset_key"):
+        get_dataset_cache().acquire(st.session_state["dataset_key"], _cache_holder())
+
     st.header("📥 Ingest Data")
 
     st.markdown("Upload a CSV file or connect to a Snowflake table.")
@@ -12,8 +44,17 @@ def render():
     uploaded_file = st.file_uploader("Upload CSV File", type=["csv"])
     if uploaded_file is not None:
         try:
-            df = pd.read_csv(uploaded_file, low_memory=False)
-            st.session_state["raw_data"] = df
+            # Hash and load once per upload; reruns reuse the session's frame (cached or not)
+            upload_id = getattr(uploaded_file, "file_id", None) or (uploaded_file.name, uploaded_file.size)
+            if st.session_state.get("upload_id") != upload_id:
+                with uploaded_file.getbuffer() as buffer:
+                    st.session_state["upload_key"] = content_key(buffer)
+                st.session_state["upload_id"] = upload_id
+            key = st.session_state["upload_key"]
+            if st.session_state.get("dataset_key") != key or "raw_data" not in st.session_state:
+                use_cached_dataset(key, lambda: pd.read_csv(uploaded_file, low_memory=False))
+            df = st.session_state["raw_data"]
+            st.session_state["dataset_name"] = uploaded_file.name
             st.success(f"✅ Uploaded `{uploaded_file.name}` successfully.")
             st.subheader("🔍 Data Preview")
             st.dataframe(df.head(20), use_container_width=True)
@@ -46,7 +87,8 @@ def render():
                     query = f"SELECT * FROM {schema}.{table} LIMIT 10000"
                     df = pd.read_sql(query, conn)
                     conn.close()
-                    st.session_state["raw_data"] = df
+                    df = use_cached_dataset(frame_key(df), lambda: df)
+                    st.session_state["dataset_name"] = f"{database}.{schema}.{table}"
                     st.success(f"✅ Loaded table `{table}` from Snowflake.")
                     st.subheader("🔍 Data Preview")
                     st.dataframe(df.head(20), use_container_width=True)
@@ -55,6 +97,25 @@ def render():
                 except Exception as e:
                     st.error(f"Error: {e}")
 
+    # --- Reference Tables (for `references` contract rules) ---
+    with st.expander("📚 Reference Tables"):
+        st.caption("Parent tables used by `references: {dataset, column}` rules. Rules may also point at a CSV/Parquet file path.")
+        ref_file = st.file_uploader("Upload Reference CSV", type=["csv"], key="reference_upload")
+        if ref_file is not None:
+            try:
+                ref_name = ref_file.name.rsplit(".", 1)[0]
+                # Parse once per upload, not on every rerun
+                ref_id = getattr(ref_file, "file_id", None) or (ref_file.name, ref_file.size)
+                if st.session_state.get("reference_upload_id") != ref_id:
+                    st.session_state.setdefault("reference_data", {})[ref_name] = pd.read_csv(ref_file, low_memory=False)
+                    st.session_state["reference_upload_id"] = ref_id
+                st.success(f"✅ Reference table `{ref_name}` loaded.")
+            except Exception as e:
+                st.error(f"❌ Error reading file: {e}")
+
+        if st.session_state.get("reference_data"):
+            st.write({name: len(ref_df) for name, ref_df in st.session_state["reference_data"].items()})
+
     # --- Load Status ---
     if "raw_data" in st.session_state:
         st.info("📦 Data loaded and ready for validation.")
@@ -0,0 +1,69 @@
+import streamlit as st
+import pandas as pd
+from dq_core.results import append_results
+from dq_core.utils import filter_results, page_window
+
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+def render_page_size(slot, key: str) -> int:
+    return slot.selectbox("Rows per page", PAGE_SIZES, index=1, key=f"{key}_page_size")
+
+
+def render_pager(total: int, page_size: int, key: str) -> int:
+    """
+    Renders the page selector for `total` rows and returns the offset of the
+    selected page. Works for in-memory frames and for tables paged in SQL alike.
+    """
+    _, page_count = page_window(total, 1, page_size)
+    page = st.number_input(
+        f"Page (1-{page_count})",
+        min_value=1,
+        max_value=page_count,
+        value=1,
+        step=1,
+        key=f"{key}_page"
+    ) if page_count > 1 else 1
+    offset, _ = page_window(total, int(page), page_size)
+    return offset
+
+
+def render_results_table(frame: pd.DataFrame, key: str, filters: tuple = ("status", "severity", "column")):
+    """
+    Renders a results DataFrame as a single filtered, paginated table.
+
+    Only the current page is sent to the browser, so rerender time does not grow
+    with the number of results.
+    """
+    if frame.empty:
+        st.info("No results to display.")
+        return
+
+    selected = {}
+    filter_cols = st.columns(len(filters) + 1)
+    for slot, name in zip(filter_cols, filters):
+        options = sorted(frame[name].dropna().astype(str).unique())
+        selected[name] = slot.multiselect(name.capitalize(), options, key=f"{key}_filter_{name}")
+
+    page_size = render_page_size(filter_cols[-1], key)
+
+    filtered = filter_results(frame, **selected)
+    offset = render_pager(len(filtered), page_size, key)
+
+    page_frame = filtered.iloc[offset:offset + page_size]
+    st.caption(f"Showing {len(page_frame)} of {len(filtered)} result(s) ({len(frame)} total).")
+    st.dataframe(page_frame, use_container_width=True, hide_index=True)
+
+
+def render_results_export(table, exports: dict, key: str):
+    """
+    Renders download buttons for prebuilt export files (see build_exports) and an
+    append-to-dataset button for a results table.
+    """
+    e1, e2, e3 = st.columns(3)
+    e1.download_button("⬇️ Parquet", exports["parquet"], f"{key}_results.parquet", "application/octet-stream", key=f"{key}_export_parquet")
+    e2.download_button("⬇️ JSONL", exports["jsonl"], f"{key}_results.jsonl", "application/jsonl", key=f"{key}_export_jsonl")
+    if e3.button("🗄️ Append to Results Dataset", key=f"{key}_export_append"):
+        path = append_results(table)
+        st.success(f"✅ Appended {table.num_rows} result(s) to `{path}`.")
@@ -0,0 +1,103 @@
+import threading
+import time
+import pandas as pd
+from dq_core.scheduler import ValidationScheduler
+
+
+def fake_warehouse(source: dict) -> pd.DataFrame:
+    """Stand-in for a warehouse connector: serves an in-memory table by name."""
+    tables = {
+        "customers": pd.DataFrame({"customer_id": [1, 2, 3, 3], "country": ["US", "DE", "FR", None]})
+    }
+    return tables[source["table"]]
+
+
+def test_run_file_and_warehouse_sources(tmp_path):
+    orders_path = tmp_path / "orders.csv"
+    pd.DataFrame({"order_id": [1, 2, 3], "amount": [10.0, 20.0, 30.0]}).to_csv(orders_path, index=False)
+
+    catalogue = [
+        {
+            "name": "orders",
+            "priority": 1,
+            "source": {"type": "file", "path": str(orders_path)},
+            "contract": {"column_checks": {"order_id": {"unique": True}}, "dataset_checks": {"row_count_min": 1}}
+        },
+        {
+            "name": "customers",
+            "priority": 5,
+            "source": {"type": "warehouse", "table": "customers"},
+            "contract": {"column_checks": {"customer_id": {"unique": True}}}
+        },
+    ]
+    scheduler = ValidationScheduler(max_workers=2, connectors={"warehouse": fake_warehouse})
+    run = scheduler.run(catalogue)
+
+    reports = {r["name"]: r for r in run["reports"]}
+    assert reports["orders"]["status"] == "done"
+    assert reports["orders"]["rows"] == 3
+    assert reports["customers"]["status"] == "done"
+    assert reports["customers"]["rows"] == 4
+    assert any(
+        r["check"] == "Contract - Unique" and r["status"] == "FAIL" for r in reports["customers"]["results"]
+    )
+    assert run["metrics"]["succeeded"] == 2
+    assert run["metrics"]["failed"] == 0
+
+
+def test_permanent_errors_are_not_retried():
+    scheduler = ValidationScheduler(max_retries=3, retry_backoff=0.01)
+    run = scheduler.run([{"name": "bad", "source": {"type": "ftp"}}])
+
+    report = run["reports"][0]
+    assert report["status"] == "failed"
+    assert report["attempts"] == 1
+    assert run["metrics"]["retries"] == 0
+
+
+def test_cancel_reports_running_and_queued_tasks():
+    started = threading.Event()
+
+    def slow_warehouse(source: dict) -> pd.DataFrame:
+        started.set()
+        time.sleep(0.3)
+        return pd.DataFrame({"id": [1, 2]})
+
+    catalogue = [{"name": f"t{i}", "source": {"type": "warehouse", "table": f"t{i}"}} for i in range(4)]
+    scheduler = ValidationScheduler(max_workers=2, source_limits={"warehouse": 2}, connectors={"warehouse": slow_warehouse})
+
+    threading.Thread(target=lambda: (started.wait(), scheduler.cancel()), daemon=True).start()
+    run = scheduler.run(catalogue)
+
+    statuses = sorted(r["status"] for r in run["reports"])
+    assert len(run["reports"]) == 4
+    assert statuses == ["cancelled", "cancelled", "done", "done"]
+
+
+def test_missing_contract_file_fails_without_retry(tmp_path):
+    data_path = tmp_path / "data.csv"
+    pd.DataFrame({"id": [1, 2]}).to_csv(data_path, index=False)
+
+    scheduler = ValidationScheduler(max_retries=3, retry_backoff=0.01)
+    run = scheduler.run([{
+        "name": "typo",
+        "source": {"type": "file", "path": str(data_path)},
+        "contract": str(tmp_path / "missing_contract.json")
+    }])
+
+    report = run["reports"][0]
+    assert report["status"] == "failed"
+    assert report["attempts"] == 1
+
+
+def test_entry_without_source_does_not_abort_batch(tmp_path):
+    data_path = tmp_path / "data.csv"
+    pd.DataFrame({"id": [1, 2]}).to_csv(data_path, index=False)
+
+    run = ValidationScheduler().run([
+        {"name": "broken"},
+        {"name": "ok", "source": {"type": "file", "path": str(data_path)}},
+    ])
+
+    statuses = {r["name"]: r["status"] for r in run["reports"]}
+    assert statuses == {"broken": "failed", "ok": "done"}